@@ -7,7 +7,9 @@ from .auth import (
     exchange_code_for_tokens,
     get_connected_user_credential,
     ensure_valid_access_token,
+    ensure_valid_access_token_sync,
     refresh_access_token,
+    refresh_access_token_sync,
     should_refresh_token,
     make_state,
     verify_state,
@@ -20,7 +22,9 @@ __all__ = [
     "exchange_code_for_tokens",
     "get_connected_user_credential",
     "ensure_valid_access_token",
+    "ensure_valid_access_token_sync",
     "refresh_access_token",
+    "refresh_access_token_sync",
     "should_refresh_token",
     "make_state",
     "verify_state",
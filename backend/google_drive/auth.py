@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-import base64
-import json
 import os
-import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 import httpx
-from sqlalchemy import select
+import orjson
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import Session
 
 from models import DataSource, GoogleDriveOauthCredentials
+from utils.db import json_shallow_merge
+from utils.http_client import get_async_client
+from utils.oauth_state import sign_state, verify_signed_state
 
 
 _client_scopes_env = os.getenv("GOOGLE_DRIVE_SCOPES")
@@ -37,64 +39,54 @@ if not CLIENT_ID or not CLIENT_SECRET or not REDIRECT_URI:
     )
 
 _STATE_TTL = timedelta(minutes=10)
-_STATE: dict[str, datetime] = {}
+_STATE_PURPOSE = "googledrive"
 
 _REFRESH_SAFETY_WINDOW = timedelta(seconds=90)
 
+_HTTP_CLIENT_NAME = "google-oauth"
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16)
+
 
 class GoogleDriveCredentialError(Exception):
     """Raised when a Google Drive credential is missing or disconnected."""
 
 
-def _b64e(payload: Dict[str, Any]) -> str:
-    body = json.dumps(payload or {}, separators=(",", ":"), ensure_ascii=False)
-    raw = base64.urlsafe_b64encode(body.encode("utf-8"))
-    return raw.decode("utf-8").rstrip("=")
-
+def _get_http_client() -> httpx.AsyncClient:
+    """토큰/사용자 정보 요청에 공유하는 커넥션 풀을 반환한다."""
 
-def _b64d(token: str) -> Dict[str, Any]:
-    pad = "=" * (-len(token) % 4)
-    decoded = base64.urlsafe_b64decode((token + pad).encode("utf-8"))
-    if not decoded:
-        return {}
-    return json.loads(decoded.decode("utf-8"))
+    return get_async_client(_HTTP_CLIENT_NAME, timeout=30, limits=_HTTP_LIMITS)
 
 
 def make_state(*, cred_idx: int, user_idx: int) -> str:
-    nonce = secrets.token_urlsafe(16)
-    _STATE[nonce] = datetime.now(timezone.utc)
-    return _b64e({"nonce": nonce, "cred_idx": cred_idx, "uid": user_idx})
+    return sign_state(_STATE_PURPOSE, cred_idx=cred_idx, user_idx=user_idx)
 
 
 def verify_state(state: str) -> Tuple[int, int]:
-    try:
-        payload = _b64d(state)
-        nonce = payload["nonce"]
-        cred_idx = int(payload["cred_idx"])
-        user_idx = int(payload["uid"])
-    except Exception as exc:  # pragma: no cover - 방어적 코드
-        raise ValueError("손상된 state 입니다.") from exc
+    return verify_signed_state(_STATE_PURPOSE, state, ttl=_STATE_TTL)
 
-    issued_at = _STATE.pop(nonce, None)
-    if not issued_at or datetime.now(timezone.utc) - issued_at > _STATE_TTL:
-        raise ValueError("state 검증 실패 또는 만료")
 
-    return cred_idx, user_idx
+# 호출마다 바뀌지 않는 authorize 파라미터는 모듈 로드 시 한 번만 구성한다.
+_AUTHORIZE_PARAMS: Dict[str, str] = {
+    "client_id": CLIENT_ID,
+    "redirect_uri": REDIRECT_URI,
+    "response_type": "code",
+    "scope": " ".join(SCOPES),
+    "access_type": "offline",
+    "include_granted_scopes": "true",
+}
 
 
-def build_authorize_url(state: str) -> str:
-    from urllib.parse import urlencode
+def build_authorize_url(state: str, *, force_consent: bool = True) -> str:
+    """Google OAuth authorize URL을 만든다.
 
-    params = {
-        "client_id": CLIENT_ID,
-        "redirect_uri": REDIRECT_URI,
-        "response_type": "code",
-        "scope": " ".join(SCOPES),
-        "access_type": "offline",
-        "include_granted_scopes": "true",
-        "prompt": "consent",
-        "state": state,
-    }
+    ``force_consent``가 참이면 ``prompt=consent``를 붙여 refresh token을 새로 발급받는다.
+    이미 refresh token이 저장된 재연결에서는 동의 화면을 생략한다.
+    """
+
+    params = dict(_AUTHORIZE_PARAMS)
+    if force_consent:
+        params["prompt"] = "consent"
+    params["state"] = state
     return f"{AUTH_URI}?{urlencode(params)}"
 
 
@@ -107,13 +99,13 @@ async def exchange_code_for_tokens(code: str) -> Tuple[Dict[str, Any], Optional[
         "grant_type": "authorization_code",
     }
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        token_response = await client.post(TOKEN_URI, data=data)
+    client = _get_http_client()
+    token_response = await client.post(TOKEN_URI, data=data)
 
     if token_response.status_code != 200:
         raise RuntimeError(token_response.text)
 
-    token_json: Dict[str, Any] = token_response.json()
+    token_json: Dict[str, Any] = orjson.loads(token_response.content)
     user_info = await _fetch_user_info(token_json.get("access_token"))
     return token_json, user_info
 
@@ -123,22 +115,13 @@ async def _fetch_user_info(access_token: Optional[str]) -> Optional[Dict[str, An
         return None
 
     headers = {"Authorization": f"Bearer {access_token}"}
-    async with httpx.AsyncClient(timeout=10) as client:
-        response = await client.get(USER_INFO_ENDPOINT, headers=headers)
+    client = _get_http_client()
+    response = await client.get(USER_INFO_ENDPOINT, headers=headers, timeout=10)
 
     if response.status_code != 200:
         return None
 
-    return response.json()
-
-
-def _merge_payload(original: Optional[Dict[str, Any]], updates: Dict[str, Any]) -> Dict[str, Any]:
-    if not original:
-        return updates
-    try:
-        return {**original, **updates}
-    except TypeError:  # pragma: no cover - defensive
-        return updates
+    return orjson.loads(response.content)
 
 
 def apply_oauth_tokens(
@@ -151,85 +134,105 @@ def apply_oauth_tokens(
 ) -> GoogleDriveOauthCredentials:
     now = datetime.now(timezone.utc)
 
-    cred.provider = "googledrive"
-    cred.token_type = (token_payload.get("token_type") or cred.token_type) or "Bearer"
+    values: Dict[str, Any] = {
+        "provider": "googledrive",
+        "token_type": (token_payload.get("token_type") or cred.token_type) or "Bearer",
+        "updated": now,
+    }
 
     access_token = token_payload.get("access_token")
     if access_token:
-        cred.access_token = access_token
+        values["access_token"] = access_token
 
     refresh_token = token_payload.get("refresh_token")
     if refresh_token:
-        cred.refresh_token = refresh_token
+        values["refresh_token"] = refresh_token
 
     scope_value = token_payload.get("scope")
     if isinstance(scope_value, str):
-        cred.scope = scope_value
+        values["scope"] = scope_value
     elif isinstance(scope_value, list):
-        cred.scope = " ".join(scope_value)
+        values["scope"] = " ".join(scope_value)
 
     id_token = token_payload.get("id_token")
     if id_token:
-        cred.id_token = id_token
+        values["id_token"] = id_token
 
     expires_in = token_payload.get("expires_in")
     expires_at = token_payload.get("expires")
     if isinstance(expires_in, (int, float)):
-        cred.expires = now + timedelta(seconds=int(expires_in))
+        values["expires"] = now + timedelta(seconds=int(expires_in))
     elif isinstance(expires_at, str):
         try:
             parsed = datetime.fromisoformat(expires_at)
             if parsed.tzinfo is None:
-                cred.expires = parsed.replace(tzinfo=timezone.utc)
+                values["expires"] = parsed.replace(tzinfo=timezone.utc)
             else:
-                cred.expires = parsed.astimezone(timezone.utc)
+                values["expires"] = parsed.astimezone(timezone.utc)
         except ValueError:
             pass
 
     if user_info:
-        cred.google_user_id = user_info.get("sub") or user_info.get("id") or cred.google_user_id
-        cred.email = user_info.get("email") or cred.email
+        values["google_user_id"] = (
+            user_info.get("sub") or user_info.get("id") or cred.google_user_id
+        )
+        values["email"] = user_info.get("email") or cred.email
 
     extra_payload = token_payload.copy()
     if user_info:
         extra_payload = {**extra_payload, "user_info": user_info}
 
-    cred.provider_payload = _merge_payload(cred.provider_payload, extra_payload)
-    cred.updated = now
+    # provider_payload는 기존 JSON 전체를 다시 보내지 않고 변경된 최상위 키만 DB에서 덮어쓴다.
+    values["provider_payload"] = json_shallow_merge(
+        GoogleDriveOauthCredentials.provider_payload, extra_payload
+    )
 
-    db.add(cred)
+    # 자격증명/데이터 소스를 각각 단일 UPDATE로 갱신하고 한 번만 커밋한다.
+    # MySQL은 RETURNING을 지원하지 않으므로 세션 내 객체는 evaluate 동기화로 갱신해
+    # 커밋 후 refresh SELECT를 생략한다.
+    db.execute(
+        update(GoogleDriveOauthCredentials)
+        .where(GoogleDriveOauthCredentials.idx == cred.idx)
+        .values(**values)
+        .execution_options(synchronize_session="evaluate")
+    )
 
     if mark_connected:
-        data_source = db.scalar(select(DataSource).where(DataSource.idx == cred.data_source_idx))
-        if data_source:
-            data_source.status = "connected"
-            db.add(data_source)
+        db.execute(
+            update(DataSource)
+            .where(DataSource.idx == cred.data_source_idx)
+            .values(status="connected")
+            .execution_options(synchronize_session="evaluate")
+        )
 
     db.commit()
-    db.refresh(cred)
     return cred
 
 
 def get_connected_user_credential(
     db: Session, *, workspace_idx: int, user_idx: int
 ) -> GoogleDriveOauthCredentials:
-    data_source = db.scalar(
-        select(DataSource).where(
+    # 데이터 소스와 자격증명을 따로 조회하지 않고 LEFT JOIN 한 번으로 가져온다.
+    row = db.execute(
+        select(DataSource.status, GoogleDriveOauthCredentials)
+        .select_from(DataSource)
+        .outerjoin(
+            GoogleDriveOauthCredentials,
+            and_(
+                GoogleDriveOauthCredentials.data_source_idx == DataSource.idx,
+                GoogleDriveOauthCredentials.user_idx == user_idx,
+            ),
+        )
+        .where(
             DataSource.workspace_idx == workspace_idx,
             DataSource.type == "googledrive",
         )
-    )
+    ).first()
 
-    if not data_source or data_source.status != "connected":
+    if row is None or row.status != "connected":
         raise GoogleDriveCredentialError("Google Drive 연동이 필요합니다.")
 
-    credential = db.scalar(
-        select(GoogleDriveOauthCredentials).where(
-            GoogleDriveOauthCredentials.data_source_idx == data_source.idx,
-            GoogleDriveOauthCredentials.user_idx == user_idx,
-        )
-    )
-
+    credential = row[1]
     if not credential or not credential.access_token:
         raise GoogleDriveCredentialError("Google Drive 연동 토큰을 찾을 수 없습니다.")
 
@@ -264,23 +267,39 @@ async def refresh_access_token(
 ) -> GoogleDriveOauthCredentials:
     """Re-issue an access token using Google's refresh token flow."""
 
+    client = _get_http_client()
+    response = await client.post(TOKEN_URI, data=_refresh_request_data(cred))
+    return _apply_refresh_response(db, cred, response)
+
+
+def refresh_access_token_sync(
+    db: Session, cred: GoogleDriveOauthCredentials
+) -> GoogleDriveOauthCredentials:
+    """Synchronous variant of :func:`refresh_access_token` for worker threads."""
+
+    response = httpx.post(TOKEN_URI, data=_refresh_request_data(cred), timeout=30)
+    return _apply_refresh_response(db, cred, response)
+
+
+def _refresh_request_data(cred: GoogleDriveOauthCredentials) -> Dict[str, str]:
     if not cred.refresh_token:
         raise RuntimeError("리프레시 토큰이 없어 access_token을 재발급할 수 없습니다.")
 
-    data = {
+    return {
         "client_id": CLIENT_ID,
         "client_secret": CLIENT_SECRET,
         "refresh_token": cred.refresh_token,
         "grant_type": "refresh_token",
     }
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.post(TOKEN_URI, data=data)
 
+def _apply_refresh_response(
+    db: Session, cred: GoogleDriveOauthCredentials, response: httpx.Response
+) -> GoogleDriveOauthCredentials:
     if response.status_code != 200:
         raise RuntimeError(f"Google 토큰 재발급 실패: {response.text}")
 
-    payload = response.json()
+    payload = orjson.loads(response.content)
     return apply_oauth_tokens(db, cred, payload, mark_connected=False)
 
 
@@ -292,3 +311,13 @@ async def ensure_valid_access_token(
     if should_refresh_token(cred):
         cred = await refresh_access_token(db, cred)
     return cred
+
+
+def ensure_valid_access_token_sync(
+    db: Session, cred: GoogleDriveOauthCredentials
+) -> GoogleDriveOauthCredentials:
+    """Synchronous variant of :func:`ensure_valid_access_token`."""
+
+    if should_refresh_token(cred):
+        cred = refresh_access_token_sync(db, cred)
+    return cred
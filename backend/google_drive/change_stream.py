@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from collections import deque
+import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import httpx
+import orjson
+
+from utils.http_client import GZIP_USER_AGENT, get_with_retry
 
 from .files import (
     CONVERTIBLE_MIME_TYPES,
@@ -31,6 +37,51 @@ _CHANGE_FIELDS = (
 
 _FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 
+# 폴더 BFS마다 MIME 조건을 다시 조립하지 않도록 모듈 로드 시 한 번만 만든다.
+_FOLDER_QUERY_PREFIX = (
+    "trashed=false and (("
+    + " or ".join(f"mimeType = '{mime}'" for mime in sorted(CONVERTIBLE_MIME_TYPES))
+    + f") or mimeType = '{_FOLDER_MIME_TYPE}')"
+)
+
+_FOLDER_LIST_PARAMS: Dict[str, Any] = {
+    "pageSize": 200,
+    "fields": (
+        "nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum,"
+        " version, webViewLink, parents, capabilities/canDownload)"
+    ),
+    "supportsAllDrives": "true",
+    "includeItemsFromAllDrives": "true",
+    "spaces": "drive",
+    "orderBy": "modifiedTime desc",
+}
+
+_FOLDER_LIST_CONCURRENCY = 8
+
+# 증분 동기화 시 루트 하위 폴더를 BFS로 구할 때 사용하는 조회 파라미터.
+# 한 요청에 여러 부모 ID를 묶어 단계(깊이)마다 필요한 요청 수를 줄인다.
+_FOLDER_TREE_PARAMS: Dict[str, Any] = {
+    "pageSize": 1000,
+    "fields": "nextPageToken, files(id)",
+    "supportsAllDrives": "true",
+    "includeItemsFromAllDrives": "true",
+    "spaces": "drive",
+}
+_FOLDER_TREE_PARENTS_PER_QUERY = 40
+
+# 워크스페이스 루트 밖으로 확인된 폴더를 (root_id, folder_id) 단위로 잠시 기억한다.
+# 폴더가 이동될 수 있으므로 짧은 TTL만 유지한다.
+_OUTSIDE_ROOT_TTL_SECONDS = 300.0
+_OUTSIDE_ROOT_CACHE_MAX = 10_000
+_OUTSIDE_ROOT_CACHE: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+# "root" 별칭이 가리키는 실제 My Drive 루트 폴더 ID. 루트 폴더는 이동되지 않으므로
+# 한 번 확인되면 이후에는 HTTP 조회 없이 루트로 판단한다.
+_KNOWN_ROOT_IDS: set[str] = set()
+
+# 연결 단계 실패는 httpx 전송 계층에서, 429/5xx 응답은 get_with_retry에서 재시도한다.
+_TRANSPORT_RETRIES = 3
+
 
 @dataclass(slots=True)
 class ChangeBatch:
@@ -43,21 +94,45 @@ class ChangeBatch:
     next_page_token: Optional[str]
 
 
+class _ChangeState(Enum):
+    INDEX = "index"
+    REMOVE = "remove"
+    SKIP = "skip"
+    PENDING = "pending"
+
+
+@dataclass(slots=True)
+class _ChangeRecord:
+    """``collect_workspace_changes`` 내부에서 파일별 처리 상태를 담는 레코드."""
+
+    file_id: str
+    state: _ChangeState
+    payload: Optional[Dict[str, Any]]
+
+
+def _new_client(*, timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers={"User-Agent": GZIP_USER_AGENT},
+        transport=httpx.AsyncHTTPTransport(retries=_TRANSPORT_RETRIES),
+    )
+
+
 async def get_start_page_token(access_token: str) -> str:
     """Google Drive Changes API용 startPageToken을 조회한다."""
 
     headers = {"Authorization": f"Bearer {access_token}"}
     params = {"supportsAllDrives": "true"}
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(
-            START_PAGE_TOKEN_ENDPOINT, headers=headers, params=params
+    async with _new_client(timeout=30) as client:
+        response = await get_with_retry(
+            client, START_PAGE_TOKEN_ENDPOINT, headers=headers, params=params
         )
 
     if response.status_code != 200:
         raise GoogleDriveAPIError(response.text)
 
-    payload = response.json()
+    payload = orjson.loads(response.content)
     token = payload.get("startPageToken")
     if not token:
         raise GoogleDriveAPIError("startPageToken을 가져오지 못했습니다.")
@@ -69,76 +144,66 @@ async def list_workspace_files(
     *,
     root_id: str,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
-    """워크스페이스 루트 이하의 변환 가능한 파일 목록을 반환한다."""
+    """워크스페이스 루트 이하의 변환 가능한 파일 목록을 반환한다.
+
+    폴더 트리는 최대 ``_FOLDER_LIST_CONCURRENCY``개의 워커가 동시에 탐색한다.
+    """
 
     headers = {"Authorization": f"Bearer {access_token}"}
-    params = {
-        "pageSize": 200,
-        "fields": (
-            "nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum,"
-            " version, webViewLink, parents, capabilities/canDownload)"
-        ),
-        "supportsAllDrives": "true",
-        "includeItemsFromAllDrives": "true",
-        "spaces": "drive",
-        "orderBy": "modifiedTime desc",
-        "q": None,
-    }
 
     convertible: List[Dict[str, Any]] = []
     skipped: List[Dict[str, str]] = []
-    queue: deque[str] = deque([root_id])
-    visited: set[str] = set()
-
-    async with httpx.AsyncClient(timeout=60) as client:
-        while queue:
-            folder_id = queue.popleft()
-            if folder_id in visited:
-                continue
-            visited.add(folder_id)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    visited: set[str] = {root_id}
+    queue.put_nowait(root_id)
 
-            folder_query = _build_folder_query(folder_id)
-            params["q"] = folder_query
+    async with _new_client(timeout=60) as client:
 
-            page_token: Optional[str] = None
+        async def worker() -> None:
             while True:
-                if page_token:
-                    params["pageToken"] = page_token
-                else:
-                    params.pop("pageToken", None)
-
-                response = await client.get(
-                    FILES_ENDPOINT, headers=headers, params=params
-                )
-                if response.status_code != 200:
-                    raise GoogleDriveAPIError(response.text)
-
-                payload = response.json()
-                files = payload.get("files", [])
-                for file in files:
-                    mime_type = file.get("mimeType") or ""
-                    file_id = file.get("id") or ""
-                    if mime_type == _FOLDER_MIME_TYPE:
-                        if file_id:
-                            queue.append(file_id)
-                        continue
-
-                    if mime_type not in CONVERTIBLE_MIME_TYPES:
-                        skipped.append(
-                            {
-                                "file_id": file_id,
-                                "name": file.get("name") or "",
-                                "mime_type": mime_type,
-                                "reason": "지원하지 않는 형식입니다.",
-                            }
-                        )
-                        continue
-
-                    convertible.append(file)
-
-                page_token = payload.get("nextPageToken")
-                if not page_token:
-                    break
+                folder_id = await queue.get()
+                try:
+                    async for file in _iter_folder_items(client, headers, folder_id):
+                        mime_type = file.get("mimeType") or ""
+                        file_id = file.get("id") or ""
+                        if mime_type == _FOLDER_MIME_TYPE:
+                            if file_id and file_id not in visited:
+                                visited.add(file_id)
+                                queue.put_nowait(file_id)
+                            continue
+
+                        if mime_type not in CONVERTIBLE_MIME_TYPES:
+                            skipped.append(
+                                {
+                                    "file_id": file_id,
+                                    "name": file.get("name") or "",
+                                    "mime_type": mime_type,
+                                    "reason": "지원하지 않는 형식입니다.",
+                                }
+                            )
+                            continue
+
+                        convertible.append(file)
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(_FOLDER_LIST_CONCURRENCY)
+        ]
+        drained = asyncio.create_task(queue.join())
+        try:
+            # 큐가 비기 전에 워커가 끝났다면 예외로 종료된 것이므로 즉시 전파한다.
+            await asyncio.wait(
+                [drained, *workers], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in workers:
+                if task.done() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            drained.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(drained, *workers, return_exceptions=True)
 
     logger.info(
         "Google Drive 루트(%s) 이하에서 %d개의 변환 대상 파일을 찾았습니다.",
@@ -148,6 +213,39 @@ async def list_workspace_files(
     return convertible, skipped
 
 
+async def _iter_folder_items(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    folder_id: str,
+) -> AsyncIterator[Dict[str, Any]]:
+    """폴더 바로 아래의 변환 대상 파일과 하위 폴더를 페이지를 받는 즉시 하나씩 반환한다.
+
+    폴더 전체 목록을 모으지 않고 페이지 단위로 소비하므로 메모리 사용량은
+    한 페이지(최대 ``pageSize``건) 수준으로 유지된다.
+    """
+
+    params: Dict[str, Any] = {
+        **_FOLDER_LIST_PARAMS,
+        "q": _build_folder_query(folder_id),
+    }
+
+    while True:
+        response = await get_with_retry(
+            client, FILES_ENDPOINT, headers=headers, params=params
+        )
+        if response.status_code != 200:
+            raise GoogleDriveAPIError(response.text)
+
+        payload = orjson.loads(response.content)
+        page_token = payload.get("nextPageToken")
+        for item in payload.get("files", []):
+            yield item
+
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+
 async def collect_workspace_changes(
     access_token: str,
     *,
@@ -158,16 +256,15 @@ async def collect_workspace_changes(
 
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    to_index: Dict[str, Dict[str, Any]] = {}
-    to_remove: set[str] = set()
-    skipped: Dict[str, Dict[str, str]] = {}
+    records: List[_ChangeRecord] = []
+    by_id: Dict[str, int] = {}
     new_start_page_token = page_token
 
     parents_cache: Dict[str, bool] = {}
 
     next_page_token: Optional[str] = None
 
-    async with httpx.AsyncClient(timeout=60) as client:
+    async with _new_client(timeout=60) as client:
         params = {
             "pageToken": page_token,
             "pageSize": 200,
@@ -178,14 +275,20 @@ async def collect_workspace_changes(
             "spaces": "drive",
         }
 
-        response = await client.get(CHANGES_ENDPOINT, headers=headers, params=params)
+        response = await get_with_retry(
+            client, CHANGES_ENDPOINT, headers=headers, params=params
+        )
         if response.status_code != 200:
             raise GoogleDriveAPIError(response.text)
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         new_start_page_token = payload.get("newStartPageToken") or new_start_page_token
         next_page_token = payload.get("nextPageToken")
 
+        changed_folders: set[str] = set()
+
+        # 같은 파일의 변경이 여러 번 내려오면 마지막 이벤트만 남긴다.
+        latest: Dict[str, Dict[str, Any]] = {}
         for change in payload.get("changes", []):
             change_type = change.get("changeType")
             if change_type and change_type != "file":
@@ -195,13 +298,17 @@ async def collect_workspace_changes(
             if not file_id:
                 continue
 
+            latest.pop(file_id, None)
+            latest[file_id] = change
+
+        for file_id, change in latest.items():
             if change.get("removed"):
-                _mark_removed(file_id, to_index, to_remove, skipped)
+                _set_change_state(records, by_id, file_id, _ChangeState.REMOVE)
                 continue
 
             file = change.get("file") or {}
             if file.get("trashed"):
-                _mark_removed(file_id, to_index, to_remove, skipped)
+                _set_change_state(records, by_id, file_id, _ChangeState.REMOVE)
                 continue
 
             file, file_id = await _resolve_change_file(
@@ -209,86 +316,201 @@ async def collect_workspace_changes(
             )
 
             if file.get("trashed"):
-                _mark_removed(file_id, to_index, to_remove, skipped)
+                _set_change_state(records, by_id, file_id, _ChangeState.REMOVE)
                 continue
 
             mime_type = file.get("mimeType") or ""
             if mime_type == _FOLDER_MIME_TYPE:
+                changed_folders.add(file_id)
                 continue
 
             if mime_type not in CONVERTIBLE_MIME_TYPES:
-                skipped[file_id] = {
-                    "file_id": file_id,
-                    "name": file.get("name") or "",
-                    "mime_type": mime_type,
-                    "reason": "지원하지 않는 형식입니다.",
-                }
-                to_index.pop(file_id, None)
-                to_remove.discard(file_id)
+                _set_change_state(
+                    records,
+                    by_id,
+                    file_id,
+                    _ChangeState.SKIP,
+                    {
+                        "file_id": file_id,
+                        "name": file.get("name") or "",
+                        "mime_type": mime_type,
+                        "reason": "지원하지 않는 형식입니다.",
+                    },
+                )
                 continue
 
             capabilities = file.get("capabilities") or {}
             if not capabilities.get("canDownload", True):
-                skipped[file_id] = {
-                    "file_id": file_id,
-                    "name": file.get("name") or "",
-                    "mime_type": mime_type,
-                    "reason": "다운로드 권한이 없습니다.",
-                }
-                to_index.pop(file_id, None)
-                to_remove.discard(file_id)
+                _set_change_state(
+                    records,
+                    by_id,
+                    file_id,
+                    _ChangeState.SKIP,
+                    {
+                        "file_id": file_id,
+                        "name": file.get("name") or "",
+                        "mime_type": mime_type,
+                        "reason": "다운로드 권한이 없습니다.",
+                    },
+                )
                 continue
 
-            parents: Iterable[str] = file.get("parents") or []
-            if parents and await _is_within_workspace(
-                client, headers, parents, root_id, parents_cache
-            ):
-                to_remove.discard(file_id)
-                skipped.pop(file_id, None)
-                to_index[file_id] = file
-            else:
-                _mark_removed(file_id, to_index, to_remove, skipped)
+            if not file.get("parents"):
+                _set_change_state(records, by_id, file_id, _ChangeState.REMOVE)
+                continue
+
+            # 워크스페이스 포함 여부는 아래에서 한 번에 병렬로 확인한다.
+            _set_change_state(records, by_id, file_id, _ChangeState.PENDING, file)
+
+        pending = [record for record in records if record.state is _ChangeState.PENDING]
+        if pending:
+            # 변경 파일마다 조상을 거슬러 올라가는 대신, 루트 하위 폴더 집합을 한 번 구해
+            # 부모 ID 포함 여부만 확인한다.
+            descendants = await _enumerate_descendant_folders(client, headers, root_id)
+
+            unresolved: List[_ChangeRecord] = []
+            for record in pending:
+                parents = record.payload.get("parents") or []
+                if any(parent in descendants for parent in parents):
+                    record.state = _ChangeState.INDEX
+                elif any(parent in changed_folders for parent in parents):
+                    # 이번 페이지에서 생성/이동된 폴더는 목록 조회 시점과 어긋날 수 있어
+                    # 기존 조상 탐색으로 한 번 더 확인한다.
+                    unresolved.append(record)
+                else:
+                    record.state = _ChangeState.REMOVE
+                    record.payload = None
+
+            loader = _FolderParentsLoader(client, headers)
+            results = await asyncio.gather(
+                *(
+                    _is_within_workspace(
+                        loader, record.payload.get("parents") or [], root_id, parents_cache
+                    )
+                    for record in unresolved
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            for record, within in zip(unresolved, results):
+                if within:
+                    record.state = _ChangeState.INDEX
+                else:
+                    record.state = _ChangeState.REMOVE
+                    record.payload = None
 
     return ChangeBatch(
-        to_index=list(to_index.values()),
-        to_remove=list(to_remove),
-        skipped=list(skipped.values()),
+        to_index=[r.payload for r in records if r.state is _ChangeState.INDEX],
+        to_remove=[r.file_id for r in records if r.state is _ChangeState.REMOVE],
+        skipped=[r.payload for r in records if r.state is _ChangeState.SKIP],
         new_start_page_token=new_start_page_token,
         next_page_token=next_page_token,
     )
 
 
-def _mark_removed(
+async def _enumerate_descendant_folders(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    root_id: str,
+) -> set[str]:
+    """``root_id``와 그 하위에 있는 모든 폴더 ID 집합을 반환한다.
+
+    루트에서 시작해 ``'{id}' in parents`` 조건으로 단계별 BFS를 수행하므로 루트 밖 폴더는
+    조회하지 않는다. 폴더 이동은 하위 폴더의 변경 이벤트를 만들지 않으므로 결과를 호출 간에
+    재사용하지 않고 ``collect_workspace_changes`` 호출마다 새로 구한다.
+    """
+
+    real_root_id = root_id
+    if root_id == "root":
+        real_root_id = await _resolve_my_drive_root_id(client, headers)
+
+    # My Drive 루트 하위는 corpora=user로 충분하고, 공유 드라이브 폴더만 allDrives가 필요하다.
+    corpora = "user" if root_id == "root" else "allDrives"
+    semaphore = asyncio.Semaphore(_FOLDER_LIST_CONCURRENCY)
+
+    async def list_children(parent_ids: List[str]) -> List[str]:
+        condition = " or ".join(f"'{parent_id}' in parents" for parent_id in parent_ids)
+        params: Dict[str, Any] = {
+            **_FOLDER_TREE_PARAMS,
+            "q": f"mimeType = '{_FOLDER_MIME_TYPE}' and trashed=false and ({condition})",
+            "corpora": corpora,
+        }
+        children: List[str] = []
+        async with semaphore:
+            while True:
+                response = await get_with_retry(
+                    client, FILES_ENDPOINT, headers=headers, params=params
+                )
+                if response.status_code != 200:
+                    raise GoogleDriveAPIError(response.text)
+
+                payload = orjson.loads(response.content)
+                children.extend(
+                    folder["id"] for folder in payload.get("files", []) if folder.get("id")
+                )
+
+                page_token = payload.get("nextPageToken")
+                if not page_token:
+                    return children
+                params["pageToken"] = page_token
+
+    descendants: set[str] = {root_id, real_root_id}
+    frontier = [real_root_id]
+    while frontier:
+        chunks = [
+            frontier[index : index + _FOLDER_TREE_PARENTS_PER_QUERY]
+            for index in range(0, len(frontier), _FOLDER_TREE_PARENTS_PER_QUERY)
+        ]
+        results = await asyncio.gather(*(list_children(chunk) for chunk in chunks))
+        frontier = []
+        for children in results:
+            for child in children:
+                if child not in descendants:
+                    descendants.add(child)
+                    frontier.append(child)
+
+    return descendants
+
+
+async def _resolve_my_drive_root_id(
+    client: httpx.AsyncClient, headers: Dict[str, str]
+) -> str:
+    """``"root"`` 별칭이 가리키는 실제 My Drive 루트 폴더 ID를 조회한다."""
+
+    metadata = await _fetch_folder_metadata(client, headers, "root")
+    root_folder_id = metadata.get("id") or "root"
+    _KNOWN_ROOT_IDS.add(root_folder_id)
+    return root_folder_id
+
+
+def _set_change_state(
+    records: List[_ChangeRecord],
+    by_id: Dict[str, int],
     file_id: str,
-    to_index: Dict[str, Dict[str, Any]],
-    to_remove: set[str],
-    skipped: Dict[str, Dict[str, str]],
+    state: _ChangeState,
+    payload: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """변경된 파일을 제거 대상으로 표시한다."""
+    """파일의 최종 처리 상태를 기록한다. 같은 파일은 마지막 상태로 덮어쓴다."""
 
     if not file_id:
         return
-    to_index.pop(file_id, None)
-    skipped.pop(file_id, None)
-    to_remove.add(file_id)
+    position = by_id.get(file_id)
+    if position is None:
+        by_id[file_id] = len(records)
+        records.append(_ChangeRecord(file_id=file_id, state=state, payload=payload))
+        return
+    record = records[position]
+    record.state = state
+    record.payload = payload
 
 
 def _build_folder_query(folder_id: str) -> str:
     """폴더 내 모든 하위 항목을 검색하기 위한 쿼리를 생성한다."""
 
-    convertible_query = " or ".join(
-        f"mimeType = '{mime}'" for mime in sorted(CONVERTIBLE_MIME_TYPES)
-    )
-    return " and ".join(
-        filter(
-            None,
-            [
-                "trashed=false",
-                f"(({convertible_query}) or mimeType = '{_FOLDER_MIME_TYPE}')",
-                f"'{folder_id}' in parents",
-            ],
-        )
-    )
+    return f"{_FOLDER_QUERY_PREFIX} and '{folder_id}' in parents"
 
 
 async def _resolve_change_file(
@@ -313,9 +535,32 @@ async def _resolve_change_file(
     return metadata, target_id
 
 
+class _FolderParentsLoader:
+    """동시에 들어온 같은 폴더의 메타데이터 조회를 하나의 요청으로 합친다."""
+
+    __slots__ = ("_client", "_headers", "_inflight", "_semaphore")
+
+    def __init__(self, client: httpx.AsyncClient, headers: Dict[str, str]) -> None:
+        self._client = client
+        self._headers = headers
+        self._inflight: Dict[str, asyncio.Future[Dict[str, Any]]] = {}
+        self._semaphore = asyncio.Semaphore(_FOLDER_LIST_CONCURRENCY)
+
+    async def parents(self, folder_id: str) -> List[str]:
+        task = self._inflight.get(folder_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(folder_id))
+            self._inflight[folder_id] = task
+        metadata = await task
+        return metadata.get("parents") or []
+
+    async def _fetch(self, folder_id: str) -> Dict[str, Any]:
+        async with self._semaphore:
+            return await _fetch_folder_metadata(self._client, self._headers, folder_id)
+
+
 async def _is_within_workspace(
-    client: httpx.AsyncClient,
-    headers: Dict[str, str],
+    loader: _FolderParentsLoader,
     parents: Iterable[str],
     root_id: str,
     cache: Dict[str, bool],
@@ -325,57 +570,104 @@ async def _is_within_workspace(
     for parent_id in parents:
         if parent_id == root_id:
             return True
-        if await _has_root_ancestor(client, headers, parent_id, root_id, cache, set()):
+        if root_id == "root" and parent_id in _KNOWN_ROOT_IDS:
+            return True
+        if await _has_root_ancestor(loader, parent_id, root_id, cache):
             return True
     return False
 
 
 async def _has_root_ancestor(
-    client: httpx.AsyncClient,
-    headers: Dict[str, str],
+    loader: _FolderParentsLoader,
     folder_id: str,
     root_id: str,
     cache: Dict[str, bool],
-    visiting: set[str],
 ) -> bool:
+    """``folder_id``에서 부모 방향으로 올라가며 ``root_id`` 도달 여부를 확인한다."""
+
     if folder_id == root_id:
         return True
-    if folder_id in visiting:
-        return False
 
-    cached = cache.get(folder_id)
-    if cached is not None:
-        return cached
+    stack: List[str] = [folder_id]
+    # 각 폴더를 스택에 넣게 만든 자식 폴더. 루트에 닿으면 이 경로만 True로 기록한다.
+    child_of: Dict[str, Optional[str]] = {folder_id: None}
+
+    while stack:
+        current = stack.pop()
+        cached = cache.get(current)
+        if cached is None and _is_known_outside(root_id, current):
+            cached = False
+        if cached is False:
+            continue
+        if cached is True or (root_id == "root" and current in _KNOWN_ROOT_IDS):
+            _mark_root_path(cache, child_of, current)
+            return True
 
-    visiting.add(folder_id)
-    metadata = await _fetch_folder_metadata(client, headers, folder_id)
-    parents = metadata.get("parents") or []
+        parents = await loader.parents(current)
 
-    # My Drive 루트는 API 상 고정 ID("root")와 실제 ID가 다를 수 있으며
-    # 실제 루트 폴더는 부모가 없으므로 이 경우를 루트로 간주한다.
-    if root_id == "root" and not parents:
-        cache[folder_id] = True
-        visiting.discard(folder_id)
-        return True
-    for parent in parents:
-        if parent == root_id or await _has_root_ancestor(
-            client, headers, parent, root_id, cache, visiting
-        ):
-            cache[folder_id] = True
-            visiting.discard(folder_id)
+        # My Drive 루트는 API 상 고정 ID("root")와 실제 ID가 다를 수 있으며
+        # 실제 루트 폴더는 부모가 없으므로 이 경우를 루트로 간주한다.
+        # 공유받은 폴더 최상단도 부모가 없을 수 있으므로 이 판단은 호출 단위 캐시에만 남기고
+        # 프로세스 전역 _KNOWN_ROOT_IDS에는 _resolve_my_drive_root_id 결과만 기록한다.
+        if root_id == "root" and not parents:
+            _mark_root_path(cache, child_of, current)
+            return True
+        if root_id in parents:
+            _mark_root_path(cache, child_of, current)
             return True
 
-    visiting.discard(folder_id)
-    cache[folder_id] = False
+        for parent in parents:
+            if parent not in child_of:
+                child_of[parent] = current
+                stack.append(parent)
+
+    # 도달 가능한 조상을 모두 확인했으므로 방문한 폴더는 전부 루트 밖에 있다.
+    for visited in child_of:
+        cache[visited] = False
+        _remember_outside(root_id, visited)
     return False
 
 
+def _mark_root_path(
+    cache: Dict[str, bool], child_of: Dict[str, Optional[str]], folder_id: str
+) -> None:
+    node: Optional[str] = folder_id
+    while node is not None:
+        cache[node] = True
+        node = child_of[node]
+
+
+def _is_known_outside(root_id: str, folder_id: str) -> bool:
+    """다른 동기화에서 루트 밖으로 확인된 폴더인지 확인한다."""
+
+    key = (root_id, folder_id)
+    expires_at = _OUTSIDE_ROOT_CACHE.get(key)
+    if expires_at is None:
+        return False
+    if expires_at < time.monotonic():
+        _OUTSIDE_ROOT_CACHE.pop(key, None)
+        return False
+    return True
+
+
+def _remember_outside(root_id: str, folder_id: str) -> None:
+    # "root"는 사용자마다 가리키는 폴더가 달라 프로세스 전역으로 공유할 수 없다.
+    if root_id == "root":
+        return
+    key = (root_id, folder_id)
+    _OUTSIDE_ROOT_CACHE.pop(key, None)
+    _OUTSIDE_ROOT_CACHE[key] = time.monotonic() + _OUTSIDE_ROOT_TTL_SECONDS
+    while len(_OUTSIDE_ROOT_CACHE) > _OUTSIDE_ROOT_CACHE_MAX:
+        _OUTSIDE_ROOT_CACHE.popitem(last=False)
+
+
 async def _fetch_folder_metadata(
     client: httpx.AsyncClient,
     headers: Dict[str, str],
     folder_id: str,
 ) -> Dict[str, Any]:
-    response = await client.get(
+    response = await get_with_retry(
+        client,
         f"{FILES_ENDPOINT}/{folder_id}",
         headers=headers,
         params={
@@ -386,7 +678,7 @@ async def _fetch_folder_metadata(
     )
     if response.status_code != 200:
         raise GoogleDriveAPIError(response.text)
-    return response.json()
+    return orjson.loads(response.content)
 
 
 async def _fetch_drive_item_metadata(
@@ -394,7 +686,8 @@ async def _fetch_drive_item_metadata(
     headers: Dict[str, str],
     file_id: str,
 ) -> Dict[str, Any]:
-    response = await client.get(
+    response = await get_with_retry(
+        client,
         f"{FILES_ENDPOINT}/{file_id}",
         headers=headers,
         params={
@@ -408,5 +701,5 @@ async def _fetch_drive_item_metadata(
     )
     if response.status_code != 200:
         raise GoogleDriveAPIError(response.text)
-    return response.json()
+    return orjson.loads(response.content)
 
@@ -2,19 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
+import math
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 import tiktoken
 from langchain_core.documents import Document
-from pypdf import PdfReader
+
+from utils.http_client import GZIP_USER_AGENT
 
 
 FILES_ENDPOINT = "https://www.googleapis.com/drive/v3/files"
@@ -59,10 +70,30 @@ _DIRECT_DOWNLOAD_MIME_TYPES = {
 
 _HWP_MIME_TYPES = {"application/x-hwp", "application/haansoft-hwp"}
 
-_ENC = tiktoken.get_encoding("cl100k_base")
+# PDF 텍스트 추출 엔진. 기본은 PDFium(pypdfium2)이며 "pypdf"로 지정하면 순수 파이썬 파서를 사용한다.
+_PDF_TEXT_BACKEND = (os.getenv("PDF_TEXT_BACKEND") or "pdfium").strip().lower()
+
+# 페이지 수가 이 값 이상인 PDF는 페이지 구간을 나눠 프로세스 풀에서 병렬로 추출한다.
+_PDF_PARALLEL_MIN_PAGES = 32
+_PDF_WORKERS = os.cpu_count() or 1
+_PDF_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PDF_PROCESS_POOL_LOCK = threading.Lock()
+
+# 다운로드 본문을 디스크로 옮길 때 사용하는 청크 크기.
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 다운로드 디렉터리에 기록하는 변환 캐시 파일 이름.
+_CONVERSION_CACHE_FILENAME = ".conversion_cache.json"
+
+# 동시에 다운로드/파싱할 최대 파일 수.
+_FILE_CONCURRENCY = 8
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
 
 _DEFAULT_CHUNK_SIZE = 800
 _DEFAULT_CHUNK_OVERLAP_RATIO = 0.1
+# 문자 기반 청크 분할 시 문자/토큰 비율을 추정하기 위해 인코딩하는 앞부분 길이.
+_CHUNK_CALIBRATION_CHARS = 4096
 
 _PDF_EXPORT_MIME = "application/pdf"
 _OPENXML_EXPORT_MIME = (
@@ -77,6 +108,18 @@ _STRUCTURED_EXPORT_MIME_TYPES = {
 _FILENAME_SANITIZE_PATTERN = re.compile(r"[^\w .-]+", re.UNICODE)
 
 
+# _list_files의 고정 검색 조건. 호출마다 다시 조립하지 않도록 모듈 로드 시 한 번만 만든다.
+_LIST_FILES_STATIC_QUERY = " and ".join(
+    [
+        "trashed=false",
+        "mimeType != 'application/vnd.google-apps.folder'",
+        "("
+        + " or ".join(f"mimeType = '{mime}'" for mime in sorted(_CONVERTIBLE_MIME_TYPES))
+        + ")",
+    ]
+)
+
+
 # 외부 모듈에서 사용할 수 있도록 공개 상수로 재노출한다.
 CONVERTIBLE_MIME_TYPES = frozenset(_CONVERTIBLE_MIME_TYPES)
 GOOGLE_NATIVE_MIME_TYPES = frozenset(_GOOGLE_NATIVE_MIME_TYPES)
@@ -105,6 +148,39 @@ class GoogleDriveFile:
     formatted_text: Optional[str] = None
 
 
+@dataclass(slots=True)
+class ChunkRecord:
+    """RAG 적재 단위인 Google Drive 파일 청크 레코드."""
+
+    file_id: str
+    title: str
+    modified_time: str
+    url: str
+    mime_type: str
+    text: str
+    formatted_text: str
+    format: str
+    pdf_path: str
+    chunk_index: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONL 직렬화용 딕셔너리로 변환한다."""
+
+        return {
+            "file_id": self.file_id,
+            "title": self.title,
+            "modified_time": self.modified_time,
+            "url": self.url,
+            "mime_type": self.mime_type,
+            "text": self.text,
+            "plain_text": self.text,
+            "formatted_text": self.formatted_text,
+            "format": self.format,
+            "pdf_path": self.pdf_path,
+            "chunk_index": self.chunk_index,
+        }
+
+
 def _format_datetime_for_query(value: datetime) -> str:
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
@@ -116,13 +192,13 @@ def _format_datetime_for_query(value: datetime) -> str:
 async def _list_files(
     client: httpx.AsyncClient,
     *,
-    access_token: str,
     modified_after: Optional[datetime] = None,
 ) -> List[Dict[str, str]]:
-    headers = {"Authorization": f"Bearer {access_token}"}
-    convertible_query = "(" + " or ".join(
-        f"mimeType = '{mime}'" for mime in sorted(_CONVERTIBLE_MIME_TYPES)
-    ) + ")"
+    query = _LIST_FILES_STATIC_QUERY
+    if modified_after:
+        query = (
+            f"{query} and modifiedTime > '{_format_datetime_for_query(modified_after)}'"
+        )
 
     params = {
         "pageSize": 200,
@@ -131,21 +207,7 @@ async def _list_files(
         "includeItemsFromAllDrives": "true",
         "spaces": "drive",
         "orderBy": "modifiedTime desc",
-        "q": " and ".join(
-            filter(
-                None,
-                [
-                    "trashed=false",
-                    "mimeType != 'application/vnd.google-apps.folder'",
-                    convertible_query,
-                    (
-                        f"modifiedTime > '{_format_datetime_for_query(modified_after)}'"
-                        if modified_after
-                        else None
-                    ),
-                ],
-            )
-        ),
+        "q": query,
     }
 
     files: List[Dict[str, str]] = []
@@ -157,13 +219,13 @@ async def _list_files(
         else:
             params.pop("pageToken", None)
 
-        response = await client.get(FILES_ENDPOINT, headers=headers, params=params)
+        response = await client.get(FILES_ENDPOINT, params=params)
         if response.status_code == 401:
             raise GoogleDriveAPIError("Google Drive 접근 권한이 만료되었습니다.")
         if response.status_code != 200:
             raise GoogleDriveAPIError(response.text)
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         files.extend(payload.get("files", []))
         page_token = payload.get("nextPageToken")
         if not page_token:
@@ -172,49 +234,210 @@ async def _list_files(
     return files
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_filename(name: str) -> str:
+    # 문자/숫자로만 이루어진 이름은 치환하거나 잘라낼 문자가 없으므로 정규식을 건너뛴다.
+    if name.isalnum():
+        return name
     sanitized = _FILENAME_SANITIZE_PATTERN.sub("_", name.strip())
     sanitized = sanitized.strip(" ._-")
     return sanitized or "document"
 
 
-def _write_file(
-    download_dir: Path, name: str, file_id: str, extension: str, content: bytes
+def _build_download_path(
+    download_dir: Path, name: str, file_id: str, extension: str
 ) -> Path:
-    download_dir.mkdir(parents=True, exist_ok=True)
     base_name = _sanitize_filename(name) or "document"
-    filename = f"{base_name}-{file_id}.{extension}"
-    path = download_dir / filename
-    path.write_bytes(content)
-    logger.info("Google Drive 파일 '%s'을(를) %s로 저장했습니다: %s", name, extension, path)
-    return path
+    return download_dir / f"{base_name}-{file_id}.{extension}"
+
+
+async def _stream_to_file(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Dict[str, str],
+    path: Path,
+) -> None:
+    """응답 본문을 메모리에 모으지 않고 청크 단위로 ``path``에 기록한다.
+
+    임시 파일에 먼저 쓰고 완료된 뒤에만 교체하므로 실패 시 기존 파일이 손상되지 않는다.
+    """
+
+    async with client.stream("GET", url, params=params) as response:
+        if response.status_code != 200:
+            await response.aread()
+            raise GoogleDriveAPIError(response.text)
+
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as temp_file:
+            try:
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    temp_file.write(chunk)
+            except BaseException:
+                temp_file.close()
+                os.unlink(temp_file.name)
+                raise
+
+    os.replace(temp_file.name, path)
 
 
 def _extract_pdf_text(pdf_path: Path) -> str:
+    backend = _resolve_pdf_backend()
+    page_count = _count_pdf_pages(pdf_path, backend)
+
+    if page_count >= _PDF_PARALLEL_MIN_PAGES and _PDF_WORKERS > 1:
+        page_texts = _extract_pdf_pages_parallel(pdf_path, backend, page_count)
+    else:
+        page_texts = _extract_pdf_page_range(str(pdf_path), backend, 0, page_count)
+
+    texts = [text.strip() for text in page_texts if text.strip()]
+    combined = "\n\n".join(texts).strip()
+    if not combined:
+        logger.warning("PDF에서 추출된 텍스트가 없습니다: %s", pdf_path)
+    return combined
+
+
+@lru_cache(maxsize=None)
+def _load_pdfium() -> Any:
+    """pypdfium2를 처음 PDF를 처리할 때 불러온다. 설치되지 않았으면 ``None``."""
+
+    try:
+        import pypdfium2
+    except ImportError:  # pragma: no cover - pypdfium2 미설치 시 pypdf로 대체
+        return None
+    return pypdfium2
+
+
+def _resolve_pdf_backend() -> str:
+    if _PDF_TEXT_BACKEND != "pypdf" and _load_pdfium() is not None:
+        return "pdfium"
+    return "pypdf"
+
+
+def _get_pdf_process_pool() -> ProcessPoolExecutor:
+    global _PDF_PROCESS_POOL
+
+    with _PDF_PROCESS_POOL_LOCK:
+        if _PDF_PROCESS_POOL is None:
+            # 멀티스레드 서버 프로세스를 fork하면 다른 스레드가 잡고 있던 잠금(logging, httpx, PDFium)을
+            # 자식이 물려받아 교착될 수 있으므로 forkserver로 깨끗한 프로세스에서 워커를 만든다.
+            _PDF_PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=_PDF_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _PDF_PROCESS_POOL
+
+
+def shutdown_pdf_process_pool() -> None:
+    """PDF 추출 프로세스 풀이 만들어졌다면 종료한다(애플리케이션 종료 시 호출)."""
+
+    global _PDF_PROCESS_POOL
+
+    with _PDF_PROCESS_POOL_LOCK:
+        pool, _PDF_PROCESS_POOL = _PDF_PROCESS_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pdf_pages_parallel(
+    pdf_path: Path, backend: str, page_count: int
+) -> List[str]:
+    """페이지 구간을 프로세스 풀에 나눠 추출하고 원래 페이지 순서로 합친다."""
+
+    span = math.ceil(page_count / _PDF_WORKERS)
+    pool = _get_pdf_process_pool()
+    futures = [
+        pool.submit(
+            _extract_pdf_page_range,
+            str(pdf_path),
+            backend,
+            start,
+            min(page_count, start + span),
+        )
+        for start in range(0, page_count, span)
+    ]
+
+    texts: List[str] = []
+    for future in futures:
+        texts.extend(future.result())
+    return texts
+
+
+def _count_pdf_pages(pdf_path: Path, backend: str) -> int:
+    try:
+        if backend == "pdfium":
+            document = _load_pdfium().PdfDocument(str(pdf_path))
+            try:
+                return len(document)
+            finally:
+                document.close()
+        from pypdf import PdfReader
+
+        return len(PdfReader(str(pdf_path)).pages)
+    except Exception as exc:  # pragma: no cover - PDF 파서 방어
+        raise UnsupportedGoogleDriveFile(f"PDF를 열 수 없습니다: {exc}") from exc
+
+
+def _extract_pdf_page_range(path: str, backend: str, start: int, end: int) -> List[str]:
+    """``[start, end)`` 페이지의 텍스트를 반환한다. 프로세스 풀 워커에서도 호출된다."""
+
+    if backend == "pdfium":
+        return _extract_pdf_pages_pdfium(path, start, end)
+    return _extract_pdf_pages_pypdf(path, start, end)
+
+
+def _extract_pdf_pages_pdfium(path: str, start: int, end: int) -> List[str]:
+    try:
+        document = _load_pdfium().PdfDocument(path)
+    except Exception as exc:  # pragma: no cover - PDF 파서 방어
+        raise UnsupportedGoogleDriveFile(f"PDF를 열 수 없습니다: {exc}") from exc
+
+    texts: List[str] = []
+    try:
+        for index in range(start, end):
+            try:
+                page = document[index]
+                text_page = page.get_textpage()
+                extracted = text_page.get_text_bounded() or ""
+                text_page.close()
+                page.close()
+            except Exception as exc:  # pragma: no cover - PDF 파서 방어
+                logger.warning(
+                    "PDF 페이지(%s, %s) 텍스트 추출에 실패했습니다: %s",
+                    Path(path).name,
+                    index,
+                    exc,
+                )
+                extracted = ""
+            texts.append(extracted.replace("\r\n", "\n"))
+    finally:
+        document.close()
+    return texts
+
+
+def _extract_pdf_pages_pypdf(path: str, start: int, end: int) -> List[str]:
+    from pypdf import PdfReader
+
     try:
-        reader = PdfReader(str(pdf_path))
+        reader = PdfReader(path)
     except Exception as exc:  # pragma: no cover - PDF 파서 방어
         raise UnsupportedGoogleDriveFile(f"PDF를 열 수 없습니다: {exc}") from exc
 
     texts: List[str] = []
-    for index, page in enumerate(reader.pages):
+    for index in range(start, end):
         try:
-            extracted = page.extract_text() or ""
+            extracted = reader.pages[index].extract_text() or ""
         except Exception as exc:  # pragma: no cover - PDF 파서 방어
             logger.warning(
                 "PDF 페이지(%s, %s) 텍스트 추출에 실패했습니다: %s",
-                pdf_path.name,
+                Path(path).name,
                 index,
                 exc,
             )
             extracted = ""
-        if extracted.strip():
-            texts.append(extracted.strip())
-
-    combined = "\n\n".join(texts).strip()
-    if not combined:
-        logger.warning("PDF에서 추출된 텍스트가 없습니다: %s", pdf_path)
-    return combined
+        texts.append(extracted)
+    return texts
 
 
 def _extract_docx_xml(docx_path: Path) -> str:
@@ -249,12 +472,68 @@ def _xml_to_plain_text(xml_text: str) -> str:
     return collapsed.strip()
 
 
+def _extract_downloaded_text(path: Path, fmt: str) -> Tuple[Optional[str], str]:
+    """다운로드한 파일에서 (서식 포함 원문, 평문)을 추출한다.
+
+    PDF는 추출 결과를 ``.txt`` 사이드카로 남겨 변경되지 않은 파일의 재동기화 시 재사용한다.
+    """
+
+    if fmt == "docx_xml":
+        formatted = _extract_docx_xml(path)
+        return formatted, _xml_to_plain_text(formatted)
+    plain = _extract_pdf_text(path)
+    path.with_suffix(".txt").write_text(plain, encoding="utf-8")
+    return None, plain
+
+
+def _load_cached_text(path: Path, fmt: str) -> Tuple[Optional[str], str]:
+    if fmt != "docx_xml":
+        sidecar = path.with_suffix(".txt")
+        if sidecar.exists():
+            return None, sidecar.read_text(encoding="utf-8")
+    return _extract_downloaded_text(path, fmt)
+
+
+def _load_conversion_cache(download_dir: Path) -> Dict[str, List[str]]:
+    """``{file_id: [modifiedTime, 저장 경로, 형식]}`` 형태의 변환 캐시를 읽는다."""
+
+    cache_path = download_dir / _CONVERSION_CACHE_FILENAME
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError:
+        logger.warning("Google Drive 변환 캐시가 손상되어 무시합니다: %s", cache_path)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_conversion_cache(download_dir: Path, cache: Dict[str, List[str]]) -> None:
+    download_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = download_dir / _CONVERSION_CACHE_FILENAME
+    temp_path = cache_path.with_suffix(".tmp")
+    temp_path.write_bytes(orjson.dumps(cache))
+    os.replace(temp_path, cache_path)
+
+
+def _lookup_cached_conversion(
+    cache: Dict[str, List[str]], file: Dict[str, str]
+) -> Optional[Tuple[Path, str]]:
+    entry = cache.get(file.get("id") or "")
+    modified_time = file.get("modifiedTime")
+    if not entry or len(entry) != 3 or not modified_time or entry[0] != modified_time:
+        return None
+    path = Path(entry[1])
+    if not path.exists():
+        return None
+    return path, entry[2]
+
+
 async def _copy_file_as_google_type(
     client: httpx.AsyncClient,
     *,
     file_id: str,
     target_mime: str,
-    headers: Dict[str, str],
     original_name: str,
 ) -> str:
     logger.info(
@@ -269,13 +548,12 @@ async def _copy_file_as_google_type(
     }
     response = await client.post(
         f"{FILES_ENDPOINT}/{file_id}/copy",
-        headers=headers,
         params={"supportsAllDrives": "true", "includeItemsFromAllDrives": "true"},
         json=body,
     )
     if response.status_code != 200:
         raise GoogleDriveAPIError(response.text)
-    payload = response.json()
+    payload = orjson.loads(response.content)
     temp_id = payload.get("id")
     if not temp_id:
         raise GoogleDriveAPIError("임시 Google 문서 ID를 가져오지 못했습니다.")
@@ -286,12 +564,10 @@ async def _delete_temporary_file(
     client: httpx.AsyncClient,
     *,
     file_id: str,
-    headers: Dict[str, str],
 ) -> None:
     try:
         response = await client.delete(
             f"{FILES_ENDPOINT}/{file_id}",
-            headers=headers,
             params={"supportsAllDrives": "true"},
         )
         if response.status_code not in {200, 204}:
@@ -308,7 +584,6 @@ async def _download_file(
     client: httpx.AsyncClient,
     *,
     file: Dict[str, str],
-    headers: Dict[str, str],
     download_dir: Path,
 ) -> Tuple[Path, str]:
     file_id = file.get("id") or ""
@@ -327,6 +602,8 @@ async def _download_file(
     export_mime = _OPENXML_EXPORT_MIME if use_openxml else _PDF_EXPORT_MIME
     file_extension = "docx" if use_openxml else "pdf"
     format_label = "docx_xml" if use_openxml else "pdf"
+    download_dir.mkdir(parents=True, exist_ok=True)
+    pdf_path = _build_download_path(download_dir, name, file_id, file_extension)
 
     if mime_type in _GOOGLE_NATIVE_MIME_TYPES:
         logger.info(
@@ -342,7 +619,6 @@ async def _download_file(
             client,
             file_id=file_id,
             target_mime=target_mime,
-            headers=headers,
             original_name=name,
         )
         export_source_id = temporary_id
@@ -353,177 +629,187 @@ async def _download_file(
 
     try:
         if mime_type in _DIRECT_DOWNLOAD_MIME_TYPES:
-            response = await client.get(
-                f"{FILES_ENDPOINT}/{export_source_id}",
-                headers=headers,
-                params={
-                    "alt": "media",
-                    "supportsAllDrives": "true",
-                    "includeItemsFromAllDrives": "true",
-                },
-            )
+            url = f"{FILES_ENDPOINT}/{export_source_id}"
+            params = {
+                "alt": "media",
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true",
+            }
         else:
-            response = await client.get(
-                f"{FILES_ENDPOINT}/{export_source_id}/export",
-                headers=headers,
-                params={
-                    "mimeType": export_mime,
-                    "supportsAllDrives": "true",
-                    "includeItemsFromAllDrives": "true",
-                },
-            )
-        if response.status_code != 200:
-            raise GoogleDriveAPIError(response.text)
-        pdf_path = _write_file(
-            download_dir, name, file_id, file_extension, response.content
+            url = f"{FILES_ENDPOINT}/{export_source_id}/export"
+            params = {
+                "mimeType": export_mime,
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true",
+            }
+        await _stream_to_file(
+            client, url, params=params, path=pdf_path
+        )
+        logger.info(
+            "Google Drive 파일 '%s'을(를) %s로 저장했습니다: %s",
+            name,
+            file_extension,
+            pdf_path,
         )
     finally:
         if temporary_id:
-            await _delete_temporary_file(client, file_id=temporary_id, headers=headers)
+            await _delete_temporary_file(client, file_id=temporary_id)
 
     return pdf_path, format_label
 
 
+@lru_cache(maxsize=None)
+def _get_encoding() -> tiktoken.Encoding:
+    """청크 분할용 토크나이저를 처음 사용할 때 한 번만 로드한다."""
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
 def _chunk_text(
     text: str,
     *,
     chunk_size: int = _DEFAULT_CHUNK_SIZE,
     overlap_ratio: float = _DEFAULT_CHUNK_OVERLAP_RATIO,
+    precise: bool = False,
 ) -> List[str]:
-    if not text:
-        return []
+    """텍스트를 ``chunk_size`` 토큰 안팎의 청크로 나눈다.
 
-    tokens = _ENC.encode(text)
-    if not tokens:
+    기본적으로 앞부분 일부만 인코딩해 문자/토큰 비율을 추정한 뒤 문자 단위로 자른다.
+    정확한 토큰 경계가 필요하면 ``precise=True``로 전체를 토큰화해 분할한다.
+    """
+
+    if not text:
         return []
 
     overlap = int(chunk_size * overlap_ratio)
     if overlap >= chunk_size:
         overlap = max(0, chunk_size - 1)
 
+    if precise:
+        return _chunk_tokens(text, chunk_size=chunk_size, overlap=overlap)
+
+    sample = text[:_CHUNK_CALIBRATION_CHARS]
+    sample_tokens = len(_get_encoding().encode_ordinary(sample))
+    if not sample_tokens:
+        return []
+
+    chars_per_token = len(sample) / sample_tokens
+    window = max(1, int(chunk_size * chars_per_token))
+    char_overlap = min(int(overlap * chars_per_token), window - 1)
+
     chunks: List[str] = []
     start = 0
-    total = len(tokens)
+    total = len(text)
 
     while start < total:
-        end = min(total, start + chunk_size)
-        chunk_tokens = tokens[start:end]
-        chunks.append(_ENC.decode(chunk_tokens))
+        end = min(total, start + window)
+        if end < total:
+            # 단어 중간에서 잘리지 않도록 창 안의 마지막 공백/줄바꿈으로 경계를 당긴다.
+            boundary = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            if boundary > start + char_overlap:
+                end = boundary
+        chunks.append(text[start:end])
         if end >= total:
             break
-        start = end - overlap if overlap > 0 else end
+        start = end - char_overlap
 
     return chunks
 
 
+def _chunk_tokens(text: str, *, chunk_size: int, overlap: int) -> List[str]:
+    enc = _get_encoding()
+    # Drive 문서에는 특수 토큰이 없으므로 특수 토큰 검사를 생략한다.
+    tokens = enc.encode_ordinary(text)
+    if not tokens:
+        return []
+
+    # 마지막 창은 끝 위치가 total에 닿는 창이므로, 시작 위치는 total - overlap 미만까지만 필요하다.
+    # 시작 위치를 range로 미리 계산하고 슬라이스가 끝을 잘라내도록 해 반복마다 분기하지 않는다.
+    step = chunk_size - overlap
+    starts = range(0, max(len(tokens) - overlap, 1), step)
+    windows = [tokens[start : start + chunk_size] for start in starts]
+
+    # 청크마다 decode를 호출하지 않고 한 번의 배치 호출로 디코딩한다.
+    return enc.decode_batch(windows)
+
+
 def _build_records_from_file(
     file: GoogleDriveFile,
     *,
     chunk_size: int = _DEFAULT_CHUNK_SIZE,
     overlap_ratio: float = _DEFAULT_CHUNK_OVERLAP_RATIO,
-) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
+) -> Iterator[ChunkRecord]:
     chunks = _chunk_text(file.text, chunk_size=chunk_size, overlap_ratio=overlap_ratio)
+    if not chunks:
+        chunks = [file.text]
 
+    # 파일 단위 필드는 같은 문자열 객체를 모든 청크 레코드가 참조한다.
     formatted_source = file.formatted_text if file.formatted_text else None
-
-    if not chunks:
-        plain_text = file.text
-        formatted_text = formatted_source or plain_text
-        records.append(
-            {
-                "file_id": file.file_id,
-                "title": file.name,
-                "modified_time": file.modified_time,
-                "url": file.web_view_link or "",
-                "mime_type": file.mime_type,
-                "text": plain_text,
-                "plain_text": plain_text,
-                "formatted_text": formatted_text,
-                "format": file.format,
-                "pdf_path": str(file.pdf_path),
-                "chunk_index": 0,
-            }
-        )
-        return records
+    url = file.web_view_link or ""
+    pdf_path = str(file.pdf_path)
 
     for chunk_index, chunk in enumerate(chunks):
-        formatted_text = formatted_source or chunk
-        records.append(
-            {
-                "file_id": file.file_id,
-                "title": file.name,
-                "modified_time": file.modified_time,
-                "url": file.web_view_link or "",
-                "mime_type": file.mime_type,
-                "text": chunk,
-                "plain_text": chunk,
-                "formatted_text": formatted_text,
-                "format": file.format,
-                "pdf_path": str(file.pdf_path),
-                "chunk_index": chunk_index,
-            }
+        yield ChunkRecord(
+            file_id=file.file_id,
+            title=file.name,
+            modified_time=file.modified_time,
+            url=url,
+            mime_type=file.mime_type,
+            text=chunk,
+            formatted_text=formatted_source or chunk,
+            format=file.format,
+            pdf_path=pdf_path,
+            chunk_index=chunk_index,
         )
 
-    return records
-
 
 def build_records_from_files(
     files: Sequence[GoogleDriveFile],
     *,
     chunk_size: int = _DEFAULT_CHUNK_SIZE,
     overlap_ratio: float = _DEFAULT_CHUNK_OVERLAP_RATIO,
-) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
-    for file in files:
-        records.extend(
+) -> List[ChunkRecord]:
+    return list(
+        chain.from_iterable(
             _build_records_from_file(
                 file, chunk_size=chunk_size, overlap_ratio=overlap_ratio
             )
+            for file in files
         )
-    return records
+    )
 
 
 def build_documents_from_records(
-    records: Sequence[Dict[str, str]],
+    records: Sequence[ChunkRecord],
     workspace_metadata: Dict[str, str],
 ) -> List[Document]:
     documents: List[Document] = []
-    for index, record in enumerate(records):
-        plain_text = record.get("plain_text") or ""
-        formatted_text = (
-            record.get("formatted_text")
-            or record.get("text")
-            or plain_text
-        )
+    for record in records:
+        plain_text = record.text
         if not plain_text.strip():
             continue
 
-        metadata = dict(workspace_metadata)
-        file_id = record.get("file_id") or ""
-        chunk_index = record.get("chunk_index")
-        if isinstance(chunk_index, int):
-            chunk_number = chunk_index
-        else:
-            chunk_number = index
-        metadata.update(
-            {
-                "page_id": file_id,
-                "page_title": record.get("title"),
-                "page_url": record.get("url"),
-                "last_edited_time": record.get("modified_time"),
-                "chunk_id": f"{file_id}:{chunk_number}",
-                "chunk_index": chunk_number,
-                "format": record.get("format", "text"),
-                "formatted_text": formatted_text,
-                "plain_text": plain_text,
-                "provider": "googledrive",
-                "file_id": file_id,
-                "file_mime_type": record.get("mime_type"),
-                "pdf_path": record.get("pdf_path"),
-            }
+        file_id = record.file_id
+        metadata = dict(
+            workspace_metadata,
+            page_id=file_id,
+            page_title=record.title,
+            page_url=record.url,
+            last_edited_time=record.modified_time,
+            chunk_id=f"{file_id}:{record.chunk_index}",
+            chunk_index=record.chunk_index,
+            format=record.format,
+            formatted_text=record.formatted_text or plain_text,
+            plain_text=plain_text,
+            provider="googledrive",
+            file_id=file_id,
+            file_mime_type=record.mime_type,
+            pdf_path=record.pdf_path,
+        )
+        # 필드가 이미 검증된 문자열/딕셔너리이므로 pydantic 검증을 건너뛴다.
+        documents.append(
+            Document.model_construct(page_content=plain_text, metadata=metadata)
         )
-        documents.append(Document(page_content=plain_text, metadata=metadata))
     return documents
 
 
@@ -534,7 +820,17 @@ async def fetch_authorized_text_files(
     download_dir: Path,
     files_override: Optional[Sequence[Dict[str, str]]] = None,
 ) -> Tuple[List[GoogleDriveFile], List[Dict[str, str]]]:
-    async with httpx.AsyncClient(timeout=60) as client:
+    # 인증 헤더는 클라이언트에 한 번만 지정하고, HTTP/2로 동시 다운로드를
+    # 하나의 연결에 다중화한다.
+    async with httpx.AsyncClient(
+        timeout=60,
+        http2=True,
+        limits=_HTTP_LIMITS,
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "User-Agent": GZIP_USER_AGENT,
+        },
+    ) as client:
         if files_override is not None:
             raw_files = list(files_override)
             logger.info(
@@ -542,81 +838,83 @@ async def fetch_authorized_text_files(
                 len(raw_files),
             )
         else:
-            raw_files = await _list_files(
-                client, access_token=access_token, modified_after=modified_after
-            )
+            raw_files = await _list_files(client, modified_after=modified_after)
 
             logger.info(
                 "Google Drive에서 %d개의 변환 대상 파일을 찾았습니다.", len(raw_files)
             )
 
-        headers = {"Authorization": f"Bearer {access_token}"}
-        converted: List[GoogleDriveFile] = []
-        skipped: List[Dict[str, str]] = []
+        semaphore = asyncio.Semaphore(_FILE_CONCURRENCY)
+        total = len(raw_files)
+        cache = await asyncio.to_thread(_load_conversion_cache, download_dir)
 
-        for index, file in enumerate(raw_files, start=1):
+        async def process(
+            index: int, file: Dict[str, str]
+        ) -> Tuple[Optional[GoogleDriveFile], Optional[Dict[str, str]]]:
             file_id = file.get("id") or ""
             name = file.get("name") or ""
             mime_type = file.get("mimeType") or ""
-            logger.info(
-                "(%d/%d) Google Drive 파일 동기화 시작: %s (%s)",
-                index,
-                len(raw_files),
-                name,
-                file_id,
-            )
 
             capabilities = file.get("capabilities") or {}
             can_download = capabilities.get("canDownload", True)
             if not can_download:
-                skipped.append(
-                    {
-                        "file_id": file_id,
-                        "name": name,
-                        "mime_type": mime_type,
-                        "reason": "다운로드 권한이 없습니다.",
-                    }
-                )
                 logger.info("파일 '%s'은(는) 다운로드 권한이 없어 건너뜁니다.", name)
-                continue
-
-            try:
-                pdf_path, fmt = await _download_file(
-                    client,
-                    file=file,
-                    headers=headers,
-                    download_dir=download_dir,
+                return None, {
+                    "file_id": file_id,
+                    "name": name,
+                    "mime_type": mime_type,
+                    "reason": "다운로드 권한이 없습니다.",
+                }
+
+            async with semaphore:
+                logger.info(
+                    "(%d/%d) Google Drive 파일 동기화 시작: %s (%s)",
+                    index,
+                    total,
+                    name,
+                    file_id,
                 )
-                if fmt == "docx_xml":
-                    formatted = _extract_docx_xml(pdf_path)
-                    plain = _xml_to_plain_text(formatted)
-                else:
-                    formatted = None
-                    plain = _extract_pdf_text(pdf_path)
-            except UnsupportedGoogleDriveFile as exc:
-                skipped.append(
-                    {
+                try:
+                    cached = _lookup_cached_conversion(cache, file)
+                    if cached is not None:
+                        # modifiedTime이 같으면 이전에 받은 파일과 추출 결과를 그대로 사용한다.
+                        pdf_path, fmt = cached
+                        logger.info("파일 '%s'은(는) 변경되지 않아 캐시를 사용합니다.", name)
+                        formatted, plain = await asyncio.to_thread(
+                            _load_cached_text, pdf_path, fmt
+                        )
+                    else:
+                        pdf_path, fmt = await _download_file(
+                            client,
+                            file=file,
+                            download_dir=download_dir,
+                        )
+                        # 파싱은 CPU 작업이므로 스레드로 넘겨 다른 파일의 다운로드와 겹치게 한다.
+                        formatted, plain = await asyncio.to_thread(
+                            _extract_downloaded_text, pdf_path, fmt
+                        )
+                except UnsupportedGoogleDriveFile as exc:
+                    logger.info("파일 '%s'은(는) 지원하지 않는 형식입니다: %s", name, exc)
+                    return None, {
                         "file_id": file_id,
                         "name": name,
                         "mime_type": mime_type,
                         "reason": str(exc),
                     }
-                )
-                logger.info("파일 '%s'은(는) 지원하지 않는 형식입니다: %s", name, exc)
-                continue
-            except GoogleDriveAPIError as exc:
-                skipped.append(
-                    {
+                except GoogleDriveAPIError as exc:
+                    logger.warning("파일 '%s' 처리 중 API 오류: %s", name, exc)
+                    return None, {
                         "file_id": file_id,
                         "name": name,
                         "mime_type": mime_type,
                         "reason": f"API 오류: {exc}",
                     }
-                )
-                logger.warning("파일 '%s' 처리 중 API 오류: %s", name, exc)
-                continue
 
-            converted.append(
+            modified_time = file.get("modifiedTime")
+            if modified_time:
+                cache[file_id] = [modified_time, str(pdf_path), fmt]
+            logger.info("파일 '%s' 동기화 완료", name)
+            return (
                 GoogleDriveFile(
                     file_id=file_id,
                     name=name,
@@ -627,8 +925,27 @@ async def fetch_authorized_text_files(
                     format=fmt,
                     pdf_path=pdf_path,
                     formatted_text=formatted,
-                )
+                ),
+                None,
             )
-            logger.info("파일 '%s' 동기화 완료", name)
+
+        results = await asyncio.gather(
+            *(process(index, file) for index, file in enumerate(raw_files, start=1)),
+            return_exceptions=True,
+        )
+
+    await asyncio.to_thread(_save_conversion_cache, download_dir, cache)
+
+    converted: List[GoogleDriveFile] = []
+    skipped: List[Dict[str, str]] = []
+    # 결과는 원래 파일 순서대로 정리하고, 예상하지 못한 예외는 모든 작업이 끝난 뒤 전파한다.
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        converted_file, skipped_file = result
+        if converted_file is not None:
+            converted.append(converted_file)
+        if skipped_file is not None:
+            skipped.append(skipped_file)
 
     return converted, skipped
@@ -1,24 +1,38 @@
 import asyncio
-import io
+import json
+import logging
+import math
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
 
 from google_drive import (
     GoogleDriveCredentialError,
-    ensure_valid_access_token,
+    ensure_valid_access_token_sync,
     get_connected_user_credential,
+    refresh_access_token_sync,
 )
 from utils.db import SessionLocal
+from utils.http_client import GZIP_USER_AGENT
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 _client_scopes_env = os.getenv("GOOGLE_DRIVE_SCOPES")
 if _client_scopes_env:
     SCOPES = [scope.strip() for scope in _client_scopes_env.split() if scope.strip()]
@@ -49,11 +63,88 @@ _GOOGLE_CONVERSION_MAP = {
 
 _DIRECT_DOWNLOAD_MIME_TYPES = {'application/pdf'}
 
-def _load_oauth_credential() -> Credentials:
-    """DB에 저장된 OAuth 자격증명으로 Google API Credentials를 생성한다."""
+# files.list 검색 조건 (상수이므로 임포트 시 한 번만 만든다)
+_CONVERTIBLE_FILES_QUERY = (
+    # 1. 변환 가능한 파일 형식 지정
+    "(" + " or ".join(f"mimeType = '{mime}'" for mime in CONVERTIBLE_MIME_TYPES) + ")"
+    # 2. 휴지통에 없는 파일
+    " and trashed=false"
+    # 3. 소유자(owners)가 나인 파일만 검색
+    " and 'me' in owners"
+)
+
+# files.list 페이지 크기 (기본 100, 최대 1000)
+_LIST_PAGE_SIZE = 1000
+
+# 동시에 변환할 최대 파일 수 (사용자당 할당량 1000회/100초 안에서 여유 있는 수준)
+_CONVERT_CONCURRENCY = 8
+# 요청 한도 초과(429, rateLimitExceeded 403) 시 재시도 횟수
+_RATE_LIMIT_RETRIES = 5
+# 403은 권한 오류/cannotExportFile 등에도 쓰이므로 아래 reason일 때만 한도 초과로 본다.
+_RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+# 사용자당 Drive 할당량(100초에 1000회)보다 약간 낮게 초당 요청 수를 제한한다.
+_REQUESTS_PER_SECOND = 8
+
+_DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+# 스트리밍 다운로드 시 한 번에 읽어 파일에 쓰는 크기
+_STREAM_CHUNK_SIZE = 1 << 20
+# 내보내기 요청의 연결/읽기 시간 제한(초). 쓰기/풀 대기는 제한하지 않는다.
+_EXPORT_TIMEOUT = httpx.Timeout(None, connect=10, read=120)
+
+# Drive 배치 요청 한 번에 담을 수 있는 최대 호출 수
+_BATCH_SIZE = 100
+
+# googleapiclient의 http 객체는 스레드 안전하지 않으므로 작업 스레드마다 service를 따로 만든다.
+# (스레드 풀 initializer에서 채운다)
+_thread_local = threading.local()
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+# 만료까지 이 시간(초) 이상 남은 캐시 자격증명은 DB 조회 없이 재사용한다.
+_CRED_CACHE_MARGIN_SECONDS = 60
+
+
+@dataclass(slots=True)
+class _CredentialCacheEntry:
+    creds: Credentials
+    expiry: float
+    service: Any = None
+
+
+_cred_cache: Dict[Tuple[int, int], _CredentialCacheEntry] = {}
+_cred_cache_lock = threading.Lock()
 
-    workspace_idx = int(os.getenv("GOOGLE_DRIVE_WORKSPACE_IDX"))
-    user_idx = int(os.getenv("GOOGLE_DRIVE_USER_IDX"))
+
+@lru_cache(maxsize=1)
+def _drive_discovery_document() -> Dict[str, Any]:
+    # 라이브러리에 포함된 Drive v3 discovery 문서(~1MB)를 프로세스당 한 번만 읽고 파싱한다.
+    document = get_static_doc('drive', 'v3')
+    if document is None:
+        raise RuntimeError("Drive v3 discovery 문서를 찾을 수 없습니다.")
+    return json.loads(document)
+
+
+def _build_drive_service(creds: Credentials):
+    # 파싱된 문서를 재사용하므로 build() 호출마다 반복되던 문서 로드/파싱이 사라진다.
+    return build_from_document(_drive_discovery_document(), credentials=creds)
+
+
+def _credential_expiry(expires: Optional[datetime]) -> float:
+    # DB의 만료 시각(naive UTC 가능)을 epoch 초로 바꾼다. 만료 정보가 없으면 무기한으로 본다.
+    if expires is None:
+        return math.inf
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires.timestamp()
+
+
+def _fetch_oauth_credential(
+    workspace_idx: int, user_idx: int, *, force_refresh: bool = False
+) -> Tuple[Credentials, float]:
+    """DB에 저장된 OAuth 자격증명으로 Google API Credentials와 만료 시각을 만든다.
+
+    ``force_refresh``가 참이면 만료 시각과 무관하게 토큰을 재발급한다.
+    """
 
     session = SessionLocal()
     try:
@@ -62,18 +153,16 @@ def _load_oauth_credential() -> Credentials:
             workspace_idx=workspace_idx,
             user_idx=user_idx,
         )
-
-        async def _ensure() -> None:
-            await ensure_valid_access_token(session, credential)
-
-        asyncio.run(_ensure())
-        session.refresh(credential)
+        if force_refresh:
+            credential = refresh_access_token_sync(session, credential)
+        else:
+            credential = ensure_valid_access_token_sync(session, credential)
 
         client_id = os.getenv("GOOGLE_CLIENT_ID")
         client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
         token_uri = os.getenv("GOOGLE_TOKEN_URI")
 
-        return Credentials(
+        creds = Credentials(
             token=credential.access_token,
             refresh_token=credential.refresh_token,
             token_uri=token_uri,
@@ -81,6 +170,7 @@ def _load_oauth_credential() -> Credentials:
             client_secret=client_secret,
             scopes=SCOPES,
         )
+        return creds, _credential_expiry(credential.expires)
     except GoogleDriveCredentialError as error:
         session.rollback()
         raise RuntimeError(
@@ -90,15 +180,49 @@ def _load_oauth_credential() -> Credentials:
         session.close()
 
 
+def _load_cached_entry(*, stale_token: Optional[str] = None) -> _CredentialCacheEntry:
+    # 토큰 만료가 임박했을 때만 DB를 다시 조회하고, 그 외에는 캐시된 항목을 재사용한다.
+    # stale_token은 401로 거부된 토큰이다. 캐시가 아직 그 토큰을 들고 있을 때만 강제로 재발급해
+    # 여러 스레드가 동시에 401을 받아도 재발급은 한 번만 일어난다.
+    workspace_idx = int(os.getenv("GOOGLE_DRIVE_WORKSPACE_IDX"))
+    user_idx = int(os.getenv("GOOGLE_DRIVE_USER_IDX"))
+    key = (workspace_idx, user_idx)
+
+    with _cred_cache_lock:
+        entry = _cred_cache.get(key)
+        force_refresh = (
+            entry is not None and stale_token is not None and entry.creds.token == stale_token
+        )
+        if (
+            force_refresh
+            or entry is None
+            or entry.expiry - time.time() <= _CRED_CACHE_MARGIN_SECONDS
+        ):
+            creds, expiry = _fetch_oauth_credential(
+                workspace_idx, user_idx, force_refresh=force_refresh
+            )
+            entry = _CredentialCacheEntry(creds=creds, expiry=expiry)
+            _cred_cache[key] = entry
+        return entry
+
+
+def _load_oauth_credential() -> Credentials:
+    """캐시된(또는 새로 조회한) Google API Credentials를 반환한다."""
+
+    return _load_cached_entry().creds
+
+
 def authenticate():
-    creds = _load_oauth_credential()
+    entry = _load_cached_entry()
 
     try:
-        service = build('drive', 'v3', credentials=creds)
-        print("구글 드라이브 인증 성공")
-        return service
+        # discovery 문서 파싱 비용이 크므로 서비스는 캐시 항목당 한 번만 만든다.
+        if entry.service is None:
+            entry.service = _build_drive_service(entry.creds)
+        logger.info("구글 드라이브 인증 성공")
+        return entry.service
     except HttpError as error:
-        print(f"서비스 생성 중 오류 발생: {error}")
+        logger.error("서비스 생성 중 오류 발생: %s", error)
         return None
 
 def get_all_convertible_files(service):
@@ -108,23 +232,17 @@ def get_all_convertible_files(service):
     all_files = []
     page_token = None
     
-    # 1. 변환 가능한 파일 형식 지정
-    query = "(" + " or ".join(f"mimeType = '{mime}'" for mime in CONVERTIBLE_MIME_TYPES) + ")"
-    # 2. 휴지통에 없는 파일
-    query += " and trashed=false"
-    # 3. 소유자(owners)가 나인 파일만 검색
-    query += " and 'me' in owners"
-    
-    print(f"내 드라이브에서 변환 가능한 모든 문서를 검색합니다...")
+    logger.info("내 드라이브에서 변환 가능한 모든 문서를 검색합니다.")
     
     try:
         while True:
-            response = service.files().list(
-                q=query,
+            response = _execute_with_backoff(service.files().list(
+                q=_CONVERTIBLE_FILES_QUERY,
                 corpora='user', 
+                pageSize=_LIST_PAGE_SIZE,
                 fields='nextPageToken, files(id, name, mimeType, driveId)', # driveId도 만약을 위해 계속 확인
                 pageToken=page_token
-            ).execute()
+            ))
             
             files = response.get('files', [])
             
@@ -132,29 +250,31 @@ def get_all_convertible_files(service):
                 if not f.get('driveId'): # driveId가 없는(None) 파일만 추가
                     all_files.append(f)
                 else:
-                    print(f"   (필터링: 공유 드라이브 파일 '{f.get('name')}' 제외)")
+                    logger.debug("필터링: 공유 드라이브 파일 '%s' 제외", f.get('name'))
             
 
             page_token = response.get('nextPageToken', None)
             if page_token is None:
                 break
             
-            print(f"   파일 {len(all_files)}개 발견... 다음 페이지 검색 중...")
+            logger.debug("파일 %d개 발견, 다음 페이지 검색 중", len(all_files))
 
-        print(f" 총 {len(all_files)}개의 변환 대상 문서를 찾았습니다.")
+        logger.info("총 %d개의 변환 대상 문서를 찾았습니다.", len(all_files))
         return all_files
 
     except HttpError as error:
-        print(f" 파일 목록 검색 중 API 오류 발생: {error}")
+        logger.error("파일 목록 검색 중 API 오류 발생: %s", error)
         return []
 
-def convert_file_to_pdf(service, file_to_convert):
+def convert_file_to_pdf(service, file_to_convert, prepared_copy_id=None):
     # 파일 1개를 PDF로 변환 
+    # 복사/삭제는 service로, 내보내기 다운로드는 요청 시점의 access token으로 직접 스트리밍한다.
+    # prepared_copy_id가 주어지면 미리 만들어 둔 임시 Google 문서를 내보내고, 삭제는 호출자가 맡는다.
     file_id = file_to_convert.get('id')
     file_name = file_to_convert.get('name')
     mime_type = file_to_convert.get('mimeType')
     
-    print(f"\n--- 🔄 '{file_name}' 변환 시작 ---")
+    logger.debug("'%s' 변환 시작", file_name)
     
     temporary_google_doc_id = None 
     file_id_to_export = None
@@ -164,27 +284,27 @@ def convert_file_to_pdf(service, file_to_convert):
         if 'google-apps' in mime_type:
             file_id_to_export = file_id
 
+        elif mime_type in _GOOGLE_CONVERSION_MAP and prepared_copy_id:
+            file_id_to_export = prepared_copy_id
+
         elif mime_type in _GOOGLE_CONVERSION_MAP:
             target_mime_type = _GOOGLE_CONVERSION_MAP[mime_type]
-            print(
-                f"   (파일이 '{mime_type}'입니다. Google 워크스페이스 형식으로 임시 변환합니다...)"
+            logger.debug(
+                "'%s' 파일을 Google 워크스페이스 형식으로 임시 변환합니다.", mime_type
             )
 
-            copy_metadata = {
-                'name': f"[임시 변환] {file_name}",
-                'mimeType': target_mime_type,
-                'parents': ['root'],
-            }
+            copy_metadata = _temporary_copy_metadata(file_name, target_mime_type)
 
-            temp_file = service.files().copy(fileId=file_id, body=copy_metadata).execute()
+            temp_file = _execute_with_backoff(
+                service.files().copy(fileId=file_id, body=copy_metadata, fields='id')
+            )
 
             temporary_google_doc_id = temp_file.get('id')
             file_id_to_export = temporary_google_doc_id
 
-            print(f"   (임시 'Google 문서' 생성 완료. ID: {temporary_google_doc_id})")
+            logger.debug("임시 'Google 문서' 생성 완료. ID: %s", temporary_google_doc_id)
 
         elif mime_type in _DIRECT_DOWNLOAD_MIME_TYPES:
-            print("   (PDF 파일은 그대로 다운로드합니다.)")
             file_id_to_export = file_id
             download_directly = True
 
@@ -193,35 +313,260 @@ def convert_file_to_pdf(service, file_to_convert):
             return False
 
         if download_directly:
-            print("   PDF 파일을 다운로드합니다")
-            request = service.files().get_media(fileId=file_id_to_export)
+            logger.debug("PDF 파일은 그대로 다운로드합니다.")
+            url = f"{_DRIVE_FILES_URL}/{file_id_to_export}"
+            params = {'alt': 'media'}
         else:
-            print("   PDF로 변환을 요청합니다 ")
-            request = service.files().export_media(
-                fileId=file_id_to_export,
-                mimeType='application/pdf'
-            )
-        
-        output_filename = f"{Path(file_name).stem}.pdf"
-        fh = io.FileIO(output_filename, 'wb')
-        downloader = MediaIoBaseDownload(fh, request)
-        
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-            print(f"   다운로드 진행 중... {int(status.progress() * 100)}%")
-
-        print(f"   -> 다운로드 성공! {output_filename} 이름으로 PDF가 저장되었습니다.")
+            logger.debug("PDF로 변환을 요청합니다.")
+            url = f"{_DRIVE_FILES_URL}/{file_id_to_export}/export"
+            params = {'mimeType': 'application/pdf'}
+
+        # 여러 스레드가 동시에 변환하므로 이름이 같은 파일(report.docx/report.xlsx 등)이
+        # 같은 경로에 섞여 쓰이지 않도록 파일 ID를 붙이고, 임시 파일에 쓴 뒤 교체한다.
+        output_filename = f"{Path(file_name).stem}_{file_id}.pdf"
+        partial_filename = f"{output_filename}.part"
+        # 변환 작업이 길어져도 만료된 토큰을 쓰지 않도록 요청 직전에 캐시에서 토큰을 읽는다.
+        access_token = _load_oauth_credential().token
+        for attempt in range(2):
+            # MediaIoBaseDownload의 청크별 Range 요청 대신 응답 본문을 한 번에 스트리밍한다.
+            _request_limiter.acquire()
+            with _get_http_client().stream(
+                'GET', url, params=params, headers={'Authorization': f'Bearer {access_token}'}
+            ) as response:
+                if response.status_code == 401 and attempt == 0:
+                    # 실행 도중 토큰이 만료/폐기되었으면 한 번만 재발급 받아 다시 요청한다.
+                    access_token = _load_cached_entry(stale_token=access_token).creds.token
+                    continue
+                if response.status_code != 200:
+                    response.read()
+                    logger.warning(
+                        "'%s' 다운로드 중 API 오류 발생: %s %s",
+                        file_name,
+                        response.status_code,
+                        response.text,
+                    )
+                    return False
+                try:
+                    with open(partial_filename, 'wb') as fh:
+                        for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+                            fh.write(chunk)
+                    os.replace(partial_filename, output_filename)
+                except BaseException:
+                    if os.path.exists(partial_filename):
+                        os.remove(partial_filename)
+                    raise
+            break
+
+        logger.info("'%s' 변환 성공: %s", file_name, output_filename)
         return True
 
     except HttpError as error:
-        print(f"'{file_name}' 변환 중 API 오류 발생: {error}")
+        logger.warning("'%s' 변환 중 API 오류 발생: %s", file_name, error)
+        return False
+
+    except httpx.HTTPError as error:
+        logger.warning("'%s' 다운로드 중 네트워크 오류 발생: %s", file_name, error)
         return False
     
     finally:
         if temporary_google_doc_id:
             try:
-                print(f"   (임시 파일(ID: {temporary_google_doc_id})을 삭제합니다...)")
-                service.files().delete(fileId=temporary_google_doc_id).execute()
+                logger.debug("임시 파일(ID: %s)을 삭제합니다.", temporary_google_doc_id)
+                _execute_with_backoff(service.files().delete(fileId=temporary_google_doc_id))
             except HttpError as error:
-                print(f"   임시 파일 삭제 중 오류 발생: {error}")
\ No newline at end of file
+                logger.warning("임시 파일 삭제 중 오류 발생: %s", error)
+
+class _TokenBucket:
+    """스레드 간에 공유하는 토큰 버킷. 토큰이 없을 때만 필요한 만큼 기다린다."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+_request_limiter = _TokenBucket(rate=_REQUESTS_PER_SECOND, capacity=_REQUESTS_PER_SECOND)
+
+
+def _is_rate_limit_error(error):
+    """429 또는 reason이 rateLimitExceeded/userRateLimitExceeded인 403만 한도 초과로 판단한다."""
+
+    if error.resp.status == 429:
+        return True
+    if error.resp.status != 403:
+        return False
+    # error_details는 응답에 따라 details/errors 중 하나로 채워지므로 본문의 errors[].reason도 함께 확인한다.
+    details = list(error.error_details) if isinstance(error.error_details, list) else []
+    try:
+        body = json.loads(error.content)
+        details.extend(body.get('error', {}).get('errors') or [])
+    except (TypeError, ValueError, AttributeError):
+        pass
+    reasons = {detail.get('reason') for detail in details if isinstance(detail, dict)}
+    return bool(reasons & _RATE_LIMIT_REASONS)
+
+
+def _execute_with_backoff(request):
+    """요청 속도를 제한하고, 한도 초과(429, rateLimitExceeded 403) 응답에만 지수 백오프(지터 포함)로 재시도한다."""
+
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        _request_limiter.acquire()
+        try:
+            return request.execute()
+        except HttpError as error:
+            if not _is_rate_limit_error(error) or attempt == _RATE_LIMIT_RETRIES:
+                raise
+            delay = min(64, 2 ** attempt) + random.random()
+            logger.debug("요청 한도 초과, %.1f초 후 재시도합니다.", delay)
+            time.sleep(delay)
+
+
+def _temporary_copy_metadata(file_name, target_mime_type):
+    return {
+        'name': f"[임시 변환] {file_name}",
+        'mimeType': target_mime_type,
+        'parents': ['root'],
+    }
+
+
+def _run_batches(service, requests, callback):
+    """(request_id, request) 목록을 배치 요청(최대 100개)으로 묶어 실행한다."""
+
+    for start in range(0, len(requests), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, request in requests[start:start + _BATCH_SIZE]:
+            # 배치 안의 호출도 Drive 할당량을 각각 소모하므로 하위 요청마다 토큰을 받는다.
+            _request_limiter.acquire()
+            batch.add(request, request_id=request_id)
+        batch.execute()
+
+
+def _prepare_temporary_copies(service, files):
+    """임시 Google 문서 변환이 필요한 파일을 배치 요청으로 한 번에 복사한다."""
+
+    copy_ids = {}
+    requests = []
+    for file in files:
+        target_mime_type = _GOOGLE_CONVERSION_MAP.get(file.get('mimeType'))
+        if not target_mime_type:
+            continue
+        metadata = _temporary_copy_metadata(file.get('name'), target_mime_type)
+        requests.append(
+            (file['id'], service.files().copy(fileId=file['id'], body=metadata, fields='id'))
+        )
+
+    def _store_copy_id(request_id, response, exception):
+        if exception is not None:
+            # 복사에 실패한 파일은 변환 단계에서 개별로 다시 시도한다.
+            logger.warning("임시 파일 생성 실패(ID: %s): %s", request_id, exception)
+            return
+        copy_ids[request_id] = response.get('id')
+
+    if requests:
+        logger.debug("임시 Google 문서 %d개를 배치로 생성합니다.", len(requests))
+        _run_batches(service, requests, _store_copy_id)
+    return copy_ids
+
+
+def _delete_temporary_copies(service, copy_ids):
+    requests = [
+        (copy_id, service.files().delete(fileId=copy_id)) for copy_id in copy_ids if copy_id
+    ]
+
+    def _report(request_id, response, exception):
+        if exception is not None:
+            logger.warning("임시 파일 삭제 중 오류 발생(ID: %s): %s", request_id, exception)
+
+    if requests:
+        logger.debug("임시 Google 문서 %d개를 배치로 삭제합니다.", len(requests))
+        _run_batches(service, requests, _report)
+
+
+def _get_http_client() -> httpx.Client:
+    # 스레드 간에 공유되는 HTTP/2 클라이언트 (연결 재사용)
+    # 큰 파일 내보내기를 위해 전체 시간 제한은 두지 않되, 멈춘 연결이 작업 스레드를 영원히
+    # 붙잡지 않도록 연결/읽기 시간 제한은 둔다.
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=True,
+                timeout=_EXPORT_TIMEOUT,
+                headers={'User-Agent': GZIP_USER_AGENT},
+            )
+        return _http_client
+
+
+def _init_convert_worker(creds: Credentials) -> None:
+    # 작업 스레드가 시작될 때 한 번, 자체 httplib2.Http를 가진 service를 만들어 스레드에 고정한다.
+    _thread_local.service = _build_drive_service(creds)
+
+
+def _convert_in_worker(file_to_convert, prepared_copy_id) -> bool:
+    return convert_file_to_pdf(_thread_local.service, file_to_convert, prepared_copy_id)
+
+
+async def convert_files_to_pdf(files, *, concurrency: int = _CONVERT_CONCURRENCY) -> List[bool]:
+    """여러 파일을 스레드 풀에서 동시에 PDF로 변환하고 파일별 성공 여부를 반환한다."""
+
+    # 캐시가 만료되면 DB 조회와 동기 토큰 갱신이 일어나므로 별도 스레드에서 실행한다.
+    creds = await asyncio.to_thread(_load_oauth_credential)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        initializer=_init_convert_worker,
+        initargs=(creds,),
+    ) as executor:
+        # 복사/삭제는 배치로 묶고, 배치가 지원되지 않는 내보내기만 파일별로 병렬 실행한다.
+        batch_service = await asyncio.to_thread(_build_drive_service, creds)
+        copy_ids = await asyncio.to_thread(_prepare_temporary_copies, batch_service, files)
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, _convert_in_worker, file, copy_ids.get(file['id'])
+                    )
+                    for file in files
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await asyncio.to_thread(
+                _delete_temporary_copies, batch_service, list(copy_ids.values())
+            )
+
+    outcomes: List[bool] = []
+    for file, result in zip(files, results):
+        if isinstance(result, BaseException):
+            logger.warning("'%s' 변환 중 오류 발생: %s", file.get('name'), result)
+            outcomes.append(False)
+        else:
+            outcomes.append(bool(result))
+
+    logger.info("총 %d개 중 %d개 파일을 PDF로 변환했습니다.", len(files), sum(outcomes))
+    return outcomes
+
+
+if __name__ == "__main__":
+    # backend 디렉터리에서 `python -m google_drive.googleDrive`로 실행한다.
+    logging.basicConfig(level=logging.INFO)
+    drive_service = authenticate()
+    if drive_service is not None:
+        asyncio.run(convert_files_to_pdf(get_all_convertible_files(drive_service)))
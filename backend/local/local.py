@@ -1,8 +1,12 @@
+from charset_normalizer import from_bytes  # 텍스트 파일의 인코딩 판별
 import docx  # Word(.docx) 파일을 읽고 분석하는 라이브러리
+from docx.oxml.ns import qn  # 'w:p' 같은 접두사 태그를 lxml 태그 이름으로 변환
 import io    # 메모리 상에서 파일을 다루기 위한 라이브러리 (파일 호환성 문제 해결용)
 from fastapi import FastAPI, UploadFile, File, HTTPException  
+from fastapi.concurrency import run_in_threadpool  # 동기 파싱을 워커 스레드에서 실행
 from fastapi.responses import FileResponse  
 from pathlib import Path  # 운영체제에 상관없이 파일 경로를 다루기
+from typing import BinaryIO
 from pyhwp import HWPReader  # pyhwp 라이브러리에서 HWPReader 가져옴
 
 
@@ -10,6 +14,42 @@ from pyhwp import HWPReader  # pyhwp 라이브러리에서 HWPReader 가져옴
 BASE_DIR = Path(__file__).resolve().parent
 app = FastAPI()
 
+# WordprocessingML 문단/텍스트 노드의 정규화된 태그 이름
+_W_P = qn("w:p")
+_W_T = qn("w:t")
+
+
+def _parse_docx(stream: BinaryIO) -> str:
+    # 파일 객체를 그대로 읽어서 문서 객체를 만들고, 모든 문단의 텍스트를 줄바꿈으로 이어 붙임
+    # Paragraph/Run 래퍼를 만들지 않고, 본문 문단(w:p)의 텍스트 노드(w:t)를 lxml로 바로 순회
+    document = docx.Document(stream)
+    body = document.element.body
+    return "\n".join(
+        "".join(node.text or "" for node in paragraph.iter(_W_T))
+        for paragraph in body.iterchildren(_W_P)
+    )
+
+
+def _parse_hwp(data: bytes) -> str:
+    # HWPReader로 가상 파일을 읽어 문서의 전체 텍스트를 추출
+    return HWPReader(io.BytesIO(data)).get_text()
+
+
+def _decode_text(data: bytes) -> str:
+    # 1. 가장 표준적인 utf-8 방식으로 먼저 시도 (대부분의 파일은 여기서 끝나며 판별 비용이 없음)
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    # 2. utf-8이 아닐 때만 charset-normalizer로 인코딩을 판별
+    #    판별은 여러 후보 인코딩을 시험하므로 utf-8 경로보다 느리지만, 드문 비 utf-8 파일에서
+    #    cp949 추측으로 바이트를 버리는 것보다 정확하므로 이 분기에서만 감수한다.
+    best = from_bytes(data).best()
+    if best is not None:
+        return str(best)
+    # 3. 판별 실패 시 윈도우 한글 환경에서 자주 사용되는 cp949로 처리
+    return data.decode('cp949', errors='ignore')
+
 
 @app.get("/")
 async def serve_html_page():
@@ -34,14 +74,10 @@ async def convert_file_to_json(file: UploadFile = File(...)):
             file_type = "docx"
             
             #.docx 파일 처리
-            # 1. 업로드된 파일의 모든 내용을 바이트(bytes) 형태로 메모리에 한번에 읽음
-            file_content = await file.read()
-            # 2. 읽어들인 바이트 데이터를 메모리 상의 가상 파일로 만듦 -> 호환성 문제 해결
-            file_stream = io.BytesIO(file_content)
-            # 3. 가상 파일을 읽어서 문서 객체를 생성
-            document = docx.Document(file_stream)
-            # 4. 문서 안의 모든 문단(paragraph)을 하나씩 순회하며 텍스트만 추출
-            content = "\n".join([para.text for para in document.paragraphs])
+            # 1. 업로드 파일(SpooledTemporaryFile)을 메모리로 복사하지 않고 그대로 넘김
+            #    -> zip 중앙 디렉터리와 필요한 파트만 읽음
+            # 2. 문서 파싱은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드풀에서 실행
+            content = await run_in_threadpool(_parse_docx, file.file)
             
         elif filename.endswith('.txt'):
             # 파일 종류를 txt로 기록합
@@ -51,13 +87,9 @@ async def convert_file_to_json(file: UploadFile = File(...)):
             # 1. 업로드된 파일의 모든 내용을 바이트(bytes) 형태로 읽음
             file_content_bytes = await file.read()
             
-            # 2. 바이트를 문자열로 변환 -> 한글 깨짐 방지를 위해 여러 인코딩을 시도
-            try:
-                # 2-1. 가장 표준적인 utf-8 방식으로 먼저 시도
-                content = file_content_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # 2-2. utf-8 실패 시 윈도우 한글 환경에서 자주 사용되는 cp949로 다시 시도
-                content = file_content_bytes.decode('cp949', errors='ignore')
+            # 2. 바이트를 문자열로 변환 -> 한글 깨짐 방지를 위해 인코딩을 판별
+            #    인코딩 판별은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드풀에서 실행
+            content = await run_in_threadpool(_decode_text, file_content_bytes)
         
         elif filename.endswith('.hwp'):
             file_type = "hwp"
@@ -66,14 +98,8 @@ async def convert_file_to_json(file: UploadFile = File(...)):
             # 1. 파일 내용을 메모리로 읽음
             file_content = await file.read()
             
-            # 2. 호환성을 위해 메모리 상의 가상 파일로 만듦
-            file_stream = io.BytesIO(file_content)
-            
-            # 3. HWPReader를 사용해 가상 파일을 읽음
-            reader = HWPReader(file_stream)
-            
-            # 4. get_text() 메소드를 사용해 문서의 전체 텍스트를 추출
-            content = reader.get_text()        
+            # 2. 텍스트 추출은 이벤트 루프를 막지 않도록 스레드풀에서 실행
+            content = await run_in_threadpool(_parse_hwp, file_content)
         
         else:
             # 지원하는 확장자가 아닐 경우 400번 에러 발생
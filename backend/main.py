@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
@@ -6,17 +9,24 @@ from routers import aiagent, notion, users, google_drive
 
 from fastapi.middleware.cors import CORSMiddleware
 
+from google_drive.files import shutdown_pdf_process_pool
+from utils.http_client import close_async_clients
 
+
+# 로그 레벨은 LOG_LEVEL 환경 변수로 조정 (기본 INFO)
 logging.basicConfig(
-    level=logging.DEBUG,                        
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s %(levelname)s %(name)s :: %(message)s",
     force=True,           # uvicorn 핸들러 삭제
 )
 
 logger = logging.getLogger("arcana")  
 
-# logging.getLogger("httpx").setLevel(logging.WARNING)
-# logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+# 요청마다 대량으로 찍히는 라이브러리 로그는 루트 레벨과 무관하게 줄인다.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 # swagger 페이지 소개
 SWAGGER_HEADERS = {
@@ -28,11 +38,30 @@ SWAGGER_HEADERS = {
     },
 }
 
+
+def _log_warmup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("AI 오케스트레이터 사전 로드 실패: %s", task.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 무거운 AI 오케스트레이터는 기동 경로에서 빼고, 요청을 받기 시작한 뒤 백그라운드에서 미리 만든다.
+    warmup = asyncio.create_task(asyncio.to_thread(aiagent.get_orchestrator))
+    warmup.add_done_callback(_log_warmup_failure)
+    yield
+    # 외부 API 호출에 공유하던 커넥션 풀 정리
+    await close_async_clients()
+    # PDF 페이지 병렬 추출용 프로세스 풀 정리
+    await asyncio.to_thread(shutdown_pdf_process_pool)
+
+
 # FastAPI 초기화
 app = FastAPI(
     title="Arcana Backend API",
     **SWAGGER_HEADERS,
-    root_path="/api"
+    root_path="/api",
+    lifespan=lifespan,
 )
 
 app.include_router(users.router)
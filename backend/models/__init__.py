@@ -12,6 +12,8 @@ from .entities import (
     GoogleDriveFileSnapshot,
     GoogleDriveSyncState,
     DataSource,
+    DataSourceStatus,
+    DataSourceType,
 )
 
 
@@ -31,5 +33,7 @@ __all__ = [
     "GoogleDriveFileSnapshot",
     "GoogleDriveSyncState",
     "DataSource",
+    "DataSourceStatus",
+    "DataSourceType",
     "DEFAULT_RAG_INDEX_NAME",
 ]
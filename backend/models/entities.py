@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import (
     BigInteger,
     Column,
+    Computed,
     DateTime,
+    Enum as SAEnum,
+    FetchedValue,
     String,
     Boolean,
     Text,
     JSON,
+    Index,
     Integer,
     UniqueConstraint,
+    func,
     text,
 )
 
+from sqlalchemy.orm import deferred
+
 from utils.db import Base
 
 
@@ -28,17 +34,34 @@ class WorkspaceType(str, Enum):
     organization = "organization"
 
 
+class DataSourceType(str, Enum):
+    """연결 가능한 데이터 소스 종류."""
+
+    notion = "notion"
+    local = "local"
+    googledrive = "googledrive"
+
+
+class DataSourceStatus(str, Enum):
+    """데이터 소스 연결 상태."""
+
+    connected = "connected"
+    disconnected = "disconnected"
+    error = "error"
+
+
 class Workspace(Base):
     """워크스페이스 메타데이터."""
 
     __tablename__ = "workspaces"
 
     idx = Column(BigInteger, primary_key=True, autoincrement=True)
-    type = Column(String(20), nullable=False)
+    # DB의 ENUM 컬럼과 동일하게 선언해 1바이트 ENUM으로 저장/비교한다.
+    type = Column(SAEnum(WorkspaceType, native_enum=True, length=20), nullable=False)
     name = Column(String(200), nullable=False)
     owner_user_idx = Column(BigInteger, nullable=True)
     organization_idx = Column(BigInteger, nullable=True)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
 
 
 class User(Base):
@@ -52,7 +75,7 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     type = Column(String(20), nullable=False)
     active = Column(Boolean, nullable=False, default=True)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
     last_login = Column(DateTime)
 
 
@@ -63,7 +86,7 @@ class Organization(Base):
 
     idx = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
 
 
 class Membership(Base):
@@ -75,7 +98,7 @@ class Membership(Base):
     organization_idx = Column(BigInteger, nullable=False)
     user_idx = Column(BigInteger, nullable=False)
     role = Column(String(50), nullable=False, default="member")
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
 
 
 class RagIndex(Base):
@@ -109,19 +132,36 @@ class NotionOauthCredentials(Base):
     access_token          = Column(Text, nullable=False)
     refresh_token         = Column(Text, nullable=True)
     expires               = Column(DateTime, nullable=True)            # MySQL DATETIME (naive)
-    created               = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
-    updated               = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
-    provider_payload      = Column(JSON, nullable=True)
+    created               = Column(DateTime, nullable=False, server_default=func.now())
+    updated               = Column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    # 원문 응답은 토큰 갱신 경로에서 읽지 않으므로 접근할 때만 로드한다.
+    provider_payload      = deferred(Column(JSON, nullable=True))
+
+    __table_args__ = (
+        # get_credential_by_workspace_id: provider + Notion workspace_id 조회
+        Index("idx_provider_ws", "provider", "provider_workspace_id"),
+        # 토큰(TEXT)이 행 크기 안에 들어가면 오버플로 페이지 없이 행 안에 저장
+        {"mysql_row_format": "DYNAMIC"},
+    )
 
 class DataSource(Base):
     __tablename__ = "data_sources"
     idx = Column(BigInteger, primary_key=True, autoincrement=True)
     workspace_idx = Column(BigInteger, nullable=False)  # FK: workspaces.idx
-    type = Column(String(20), nullable=False)           # 'notion', 'googledrive', 'local'
+    type = Column(SAEnum(DataSourceType, native_enum=True, length=20), nullable=False)
     name = Column(String(200), nullable=False)
-    status = Column(String(20), nullable=False, default="connected")  # connected/disconnected/error
+    status = Column(
+        SAEnum(DataSourceStatus, native_enum=True, length=20),
+        nullable=False,
+        default=DataSourceStatus.connected,
+    )
     synced = Column(DateTime, nullable=True)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # 워크스페이스의 소스 종류별 조회(workspace_idx + type)
+        Index("idx_ws_type", "workspace_idx", "type"),
+    )
 
 
 class GoogleDriveOauthCredentials(Base):
@@ -139,9 +179,25 @@ class GoogleDriveOauthCredentials(Base):
     scope = Column(Text, nullable=True)
     id_token = Column(Text, nullable=True)
     expires = Column(DateTime, nullable=True)
-    created = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
-    updated = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
-    provider_payload = Column(JSON, nullable=True)
+    created = Column(DateTime, nullable=False, server_default=func.now())
+    updated = Column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    # 원문 응답은 큰 JSON이므로 접근할 때만 로드하고, 자주 쓰는 값은 생성 컬럼으로 읽는다.
+    provider_payload = deferred(Column(JSON, nullable=True))
+    workspace_root_id = Column(
+        String(255),
+        Computed(
+            "COALESCE("
+            "provider_payload->>'$.workspace_root_id', "
+            "provider_payload->>'$.root_folder_id', "
+            "provider_payload->>'$.selected_folder_id')",
+            persisted=True,
+        ),
+    )
+
+    __table_args__ = (
+        # 토큰(TEXT)이 행 크기 안에 들어가면 오버플로 페이지 없이 행 안에 저장
+        {"mysql_row_format": "DYNAMIC"},
+    )
 
 
 class GoogleDriveSyncState(Base):
@@ -156,8 +212,8 @@ class GoogleDriveSyncState(Base):
     latest_history_id = Column(String(255), nullable=True)
     bootstrapped_at = Column(DateTime, nullable=True)
     last_synced = Column(DateTime, nullable=True)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created = Column(DateTime, nullable=False, server_default=func.now())
+    updated = Column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
 
 class GoogleDriveFileSnapshot(Base):
@@ -174,9 +230,9 @@ class GoogleDriveFileSnapshot(Base):
     version = Column(BigInteger, nullable=True)
     modified_time = Column(DateTime, nullable=True)
     web_view_link = Column(String(1024), nullable=True)
-    last_synced = Column(DateTime, nullable=False, default=datetime.utcnow)
-    created = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_synced = Column(DateTime, nullable=False, server_default=func.now())
+    created = Column(DateTime, nullable=False, server_default=func.now())
+    updated = Column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
     __table_args__ = (
         UniqueConstraint("data_source_idx", "file_id", name="uk_google_drive_file"),
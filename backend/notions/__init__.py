@@ -1,22 +1,29 @@
-"""Notion 관련 헬퍼 함수를 노출합니다."""
-
-from .notionAuth import (
-    build_authorize_url,
-    make_state,
-    verify_state,
-    exchange_code_for_tokens,
-    apply_oauth_tokens,
-    should_refresh_token,
-    get_credential_by_workspace_id,
-    refresh_access_token,
-    ensure_valid_access_token,
-)
-from .notionPull import pull_all_shared_page_text, pull_page_text
-from .ragTransform import (  # 노션 페이지 전처리 및 문서화를 담당하는 헬퍼들을 임포트하는 주석
-    build_jsonl_records_from_pages,  # JSONL 레코드를 생성하는 함수를 임포트하는 주석
-    build_documents_from_records,  # JSONL 레코드를 LangChain 문서로 변환하는 함수를 임포트하는 주석
-    build_documents_from_pages,  # 페이지에서 직접 LangChain 문서를 생성하는 함수를 임포트하는 주석
-)
+"""Notion 관련 헬퍼 함수를 노출합니다.
+
+하위 모듈(특히 tiktoken/LangChain을 쓰는 ragTransform)은 처음 접근할 때
+임포트해서 ``notions.notionAuth``만 필요한 경로가 무거운 의존성을 읽지 않게 한다.
+"""
+
+from importlib import import_module
+from typing import Any
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_ATTRS = {
+    "build_authorize_url": ".notionAuth",
+    "make_state": ".notionAuth",
+    "verify_state": ".notionAuth",
+    "exchange_code_for_tokens": ".notionAuth",
+    "apply_oauth_tokens": ".notionAuth",
+    "should_refresh_token": ".notionAuth",
+    "get_credential_by_workspace_id": ".notionAuth",
+    "refresh_access_token": ".notionAuth",
+    "ensure_valid_access_token": ".notionAuth",
+    "pull_page_text": ".notionPull",
+    "pull_all_shared_page_text": ".notionPull",
+    "build_jsonl_records_from_pages": ".ragTransform",  # JSONL 레코드 생성
+    "build_documents_from_records": ".ragTransform",  # JSONL 레코드 -> LangChain 문서
+    "build_documents_from_pages": ".ragTransform",  # 페이지 -> LangChain 문서
+}
 
 __all__ = [
     "build_authorize_url",
@@ -34,3 +41,16 @@ __all__ = [
     "build_documents_from_records",
     "build_documents_from_pages",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
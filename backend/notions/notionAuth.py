@@ -3,18 +3,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import json
-import base64
-import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 
 import httpx
-from sqlalchemy import select
+from notion_client import AsyncClient
+from sqlalchemy import and_, inspect, select, update
 from sqlalchemy.orm import Session
 
 from models import NotionOauthCredentials, DataSource
+from utils.db import json_shallow_merge
+from utils.http_client import get_async_client, get_async_transport
+from utils.oauth_state import sign_state, verify_signed_state
 
 
 CLIENT_ID = os.getenv("NOTION_CLIENT_ID")
@@ -25,25 +27,52 @@ if not CLIENT_ID or not CLIENT_SECRET or not REDIRECT_URI:
 
 NOTION_AUTH_URL = "https://api.notion.com/v1/oauth/authorize"
 NOTION_TOKEN_URL = "https://api.notion.com/v1/oauth/token"
+# Notion API requires an explicit version header for consistent payload shapes.
+NOTION_VERSION = "2022-06-28"
 
 _REFRESH_SAFETY_WINDOW = timedelta(seconds=90)
 
-# ---- In-memory state (redis로 바꿔야함) ----
-_STATE: dict[str, datetime] = {}
+_HTTP_CLIENT_NAME = "notion-oauth"
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# 토큰 엔드포인트 인증 정보는 요청마다 만들지 않고 한 번만 생성한다.
+_TOKEN_AUTH = httpx.BasicAuth(CLIENT_ID, CLIENT_SECRET)
+_API_TRANSPORT_NAME = "notion-api"
+_API_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# (user_idx, data_source_idx)별 토큰 갱신 잠금 (동시 갱신 방지)
+_REFRESH_LOCKS: dict[Tuple[int, int], asyncio.Lock] = {}
+
+# OAuth state는 서명된 자기검증 토큰으로 발급한다. 검증에 성공한 state는 한 번만 쓸 수 있도록
+# 서명을 기록한다(REDIS_URL이 있으면 Redis, 없으면 프로세스 메모리; utils.oauth_state 참고).
 _STATE_TTL = timedelta(minutes=10)
+_STATE_PURPOSE = "notion"
 
 
 class NotionCredentialError(Exception):
     """노션 자격증명이 없거나 연결되지 않았을 때 사용하는 예외."""
 
 
-def _b64e(d: dict) -> str:
-    raw = json.dumps(d, separators=(",", ":"), ensure_ascii=False).encode()
-    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+def _get_http_client() -> httpx.AsyncClient:
+    """토큰 발급/재발급 요청에 공유하는 커넥션 풀을 반환한다."""
+
+    return get_async_client(_HTTP_CLIENT_NAME, timeout=30, limits=_HTTP_LIMITS)
+
+
+def build_api_client(access_token: str) -> AsyncClient:
+    """Notion API 호출용 ``AsyncClient``를 만든다.
+
+    notion_client는 인증 헤더를 httpx 클라이언트에 직접 설정하므로 클라이언트는 토큰별로 만들되,
+    커넥션 풀(transport)은 프로세스 전체에서 공유해 호출마다 TCP/TLS 연결을 새로 맺지 않는다.
+    반환된 클라이언트를 닫으면 공유 transport도 닫히므로 ``aclose()``/``async with``를 쓰지 않는다.
+    """
+
+    transport = get_async_transport(_API_TRANSPORT_NAME, limits=_API_LIMITS)
+    return AsyncClient(
+        auth=access_token,
+        notion_version=NOTION_VERSION,
+        client=httpx.AsyncClient(transport=transport),
+    )
 
-def _b64d(s: str) -> dict:
-    pad = "=" * (-len(s) % 4)
-    return json.loads(base64.urlsafe_b64decode(s + pad))
 
 def build_authorize_url(state: str) -> str:
     from urllib.parse import urlencode
@@ -57,31 +86,17 @@ def build_authorize_url(state: str) -> str:
     return f"{NOTION_AUTH_URL}?{q}"
 
 def make_state(cred_idx: int, user_idx: int) -> str:
-    nonce = secrets.token_urlsafe(16)
-    _STATE[nonce] = datetime.now(timezone.utc)
-    return _b64e({"nonce": nonce, "cred_idx": cred_idx, "uid": user_idx})
+    return sign_state(_STATE_PURPOSE, cred_idx=cred_idx, user_idx=user_idx)
 
 def verify_state(state: str) -> Tuple[int, int]:
-    try:
-        p = _b64d(state)
-        nonce = p["nonce"]
-        cred_idx = int(p["cred_idx"])
-        user_idx = int(p["uid"])
-    except Exception as e:
-        raise ValueError("손상된 state 입니다.") from e
-    ts = _STATE.pop(nonce, None)
-    if not ts or datetime.now(timezone.utc) - ts > _STATE_TTL:
-        raise ValueError("state 검증 실패 또는 만료")
-    return cred_idx, user_idx
+    return verify_signed_state(_STATE_PURPOSE, state, ttl=_STATE_TTL)
 
 async def exchange_code_for_tokens(code: str) -> Dict[str, Any]:
-    auth = httpx.BasicAuth(CLIENT_ID, CLIENT_SECRET)
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.post(
-            NOTION_TOKEN_URL,
-            auth=auth,
-            json={"grant_type": "authorization_code", "code": code, "redirect_uri": REDIRECT_URI},
-        )
+    r = await _get_http_client().post(
+        NOTION_TOKEN_URL,
+        auth=_TOKEN_AUTH,
+        json={"grant_type": "authorization_code", "code": code, "redirect_uri": REDIRECT_URI},
+    )
     if r.status_code != 200:
         raise RuntimeError(r.text)
     return r.json()
@@ -107,22 +122,25 @@ def apply_oauth_tokens(
         except Exception:
             pass
     cred.updated = now
-    previous_payload = cred.provider_payload or {}
-    try:
-        merged_payload = {**previous_payload, **data}
-    except TypeError:
-        merged_payload = data
-    cred.provider_payload = merged_payload
+    if inspect(cred).persistent:
+        # 기존 JSON을 읽어 파이썬에서 병합하지 않고, 변경된 최상위 키만 DB에서 덮어쓴다.
+        cred.provider_payload = json_shallow_merge(NotionOauthCredentials.provider_payload, data)
+    else:
+        cred.provider_payload = data
     db.add(cred)
 
     if mark_connected:
-        ds = db.scalar(select(DataSource).where(DataSource.idx == cred.data_source_idx))
-        if ds:
-            ds.status = "connected"
-            db.add(ds)
+        # 데이터 소스를 조회하지 않고 단일 UPDATE로 상태만 갱신한다.
+        db.execute(
+            update(DataSource)
+            .where(DataSource.idx == cred.data_source_idx)
+            .values(status="connected")
+            .execution_options(synchronize_session="evaluate")
+        )
 
+    # 토큰 저장과 연결 상태 갱신을 한 트랜잭션으로 커밋한다. 토큰 값은 이미 객체에 있으므로
+    # 재조회(db.refresh)하지 않고, DB가 채우는 updated/provider_payload는 접근할 때만 로드된다.
     db.commit()
-    db.refresh(cred)
     return cred
 
 
@@ -172,23 +190,27 @@ def get_connected_user_credential(
 ) -> NotionOauthCredentials:
     """워크스페이스 소유 데이터를 기반으로 연결된 Notion 자격증명을 조회한다."""
 
-    data_source = db.scalar(
-        select(DataSource).where(
+    # 데이터 소스와 자격증명을 따로 조회하지 않고 LEFT JOIN 한 번으로 가져온다.
+    row = db.execute(
+        select(DataSource.status, NotionOauthCredentials)
+        .select_from(DataSource)
+        .outerjoin(
+            NotionOauthCredentials,
+            and_(
+                NotionOauthCredentials.data_source_idx == DataSource.idx,
+                NotionOauthCredentials.user_idx == user_idx,
+            ),
+        )
+        .where(
             DataSource.workspace_idx == workspace_idx,
             DataSource.type == "notion",
         )
-    )
+    ).first()
 
-    if not data_source or data_source.status != "connected":
+    if row is None or row.status != "connected":
         raise NotionCredentialError("Notion 연동이 필요합니다.")
 
-    credential = db.scalar(
-        select(NotionOauthCredentials).where(
-            NotionOauthCredentials.data_source_idx == data_source.idx,
-            NotionOauthCredentials.user_idx == user_idx,
-        )
-    )
-
+    credential = row[1]
     if not credential or not credential.access_token:
         raise NotionCredentialError("Notion 연동 토큰을 찾을 수 없습니다.")
 
@@ -203,16 +225,14 @@ async def refresh_access_token(
     if not cred.refresh_token:
         raise RuntimeError("리프레시 토큰이 없어 access_token을 재발급할 수 없습니다.")
 
-    auth = httpx.BasicAuth(CLIENT_ID, CLIENT_SECRET)
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            NOTION_TOKEN_URL,
-            auth=auth,
-            json={
-                "grant_type": "refresh_token",
-                "refresh_token": cred.refresh_token,
-            },
-        )
+    resp = await _get_http_client().post(
+        NOTION_TOKEN_URL,
+        auth=_TOKEN_AUTH,
+        json={
+            "grant_type": "refresh_token",
+            "refresh_token": cred.refresh_token,
+        },
+    )
 
     if resp.status_code != 200:
         raise RuntimeError(f"Notion 토큰 재발급 실패: {resp.text}")
@@ -224,8 +244,19 @@ async def refresh_access_token(
 async def ensure_valid_access_token(
     db: Session, cred: NotionOauthCredentials
 ) -> NotionOauthCredentials:
-    """Return credentials, refreshing the access token once if needed."""
+    """Return credentials, refreshing the access token once if needed.
+
+    유효한 토큰은 DB/네트워크 접근 없이 바로 반환한다. 갱신이 필요하면 자격증명별
+    잠금으로 동시 갱신을 하나로 합치고, 먼저 끝난 갱신 결과를 DB에서 다시 읽어 재사용한다.
+    """
+
+    if not should_refresh_token(cred):
+        return cred
 
-    if should_refresh_token(cred):
-        cred = await refresh_access_token(db, cred)
+    lock = _REFRESH_LOCKS.setdefault((cred.user_idx, cred.data_source_idx), asyncio.Lock())
+    async with lock:
+        # 대기하는 동안 다른 요청이 갱신(리프레시 토큰 교체 포함)했을 수 있으므로 다시 확인한다.
+        db.refresh(cred)
+        if should_refresh_token(cred):
+            cred = await refresh_access_token(db, cred)
     return cred
@@ -5,14 +5,11 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from notion_client import AsyncClient
 from sqlalchemy.orm import Session
 
 from models import NotionOauthCredentials
 
-from .notionAuth import ensure_valid_access_token
-
-_NOTION_VERSION = "2022-06-28"
+from .notionAuth import build_api_client, ensure_valid_access_token
 
 
 @dataclass(slots=True)
@@ -307,19 +304,16 @@ async def create_page_from_markdown(
     """마크다운 콘텐츠를 기반으로 노션 페이지를 생성한다."""
 
     refreshed = await ensure_valid_access_token(db, cred)
-    client = AsyncClient(auth=refreshed.access_token, notion_version=_NOTION_VERSION)
-    try:
-        response = await client.pages.create(
-            parent={"type": "workspace", "workspace": True},
-            properties={
-                "title": {
-                    "title": _rich_text(title if title else "제목 없음", chunk_size=400),
-                }
-            },
-            children=_markdown_to_blocks(markdown),
-        )
-    finally:
-        await client.aclose()
+    client = build_api_client(refreshed.access_token)
+    response = await client.pages.create(
+        parent={"type": "workspace", "workspace": True},
+        properties={
+            "title": {
+                "title": _rich_text(title if title else "제목 없음", chunk_size=400),
+            }
+        },
+        children=_markdown_to_blocks(markdown),
+    )
 
     page_id = response.get("id") or ""
     url = response.get("url") or ""
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import random
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from notion_client import AsyncClient
+from notion_client.errors import APIResponseError
 
 from models import NotionOauthCredentials
 from sqlalchemy.orm import Session
 
-from .notionAuth import ensure_valid_access_token
+from .notionAuth import build_api_client, ensure_valid_access_token
 
-# Notion API requires an explicit version header for consistent payload shapes.
-_NOTION_VERSION = "2022-06-28"
+# 페이지 블록을 동시에 수집할 최대 페이지 수
+_PAGE_FETCH_CONCURRENCY = 8
+# 하위 블록 트리를 병렬로 탐색할 때 동시에 보낼 blocks.children.list 요청 수
+_BLOCK_FETCH_CONCURRENCY = 8
+# 429(rate_limited) 응답 재시도 횟수와 최대 대기 시간(초)
+_RATE_LIMIT_RETRIES = 5
+_RATE_LIMIT_MAX_DELAY = 30.0
 
 # Block types that should be ignored entirely because they primarily contain
 # non-textual payloads (images, files, media, etc.).
@@ -246,18 +254,70 @@ def _extract_text_payload(block: Dict[str, Any]) -> List[str]:
     return [line for line in lines if isinstance(line, str) and line]
 
 
-async def _collect_children(client: AsyncClient, block_id: str) -> List[Dict[str, Any]]:
+async def _call_with_backoff(request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run a Notion API call, retrying HTTP 429 responses with backoff.
+
+    ``Retry-After``가 있으면 그 값을 따르고, 없으면 지터를 더한 지수 백오프로 기다린다.
+    """
+
+    attempt = 0
+    while True:
+        try:
+            return await request()
+        except APIResponseError as exc:
+            if exc.status != 429 or attempt >= _RATE_LIMIT_RETRIES:
+                raise
+            retry_after = exc.headers.get("Retry-After") if exc.headers else None
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = 2 ** attempt + random.random()
+            attempt += 1
+            await asyncio.sleep(min(delay, _RATE_LIMIT_MAX_DELAY))
+
+
+@dataclass(slots=True)
+class _BlockFetchContext:
+    """State shared by every block fetch within one pull operation."""
+
+    # 요청 중에만 슬롯을 점유해 429 백오프 대기가 다른 요청을 막지 않도록 한다.
+    limiter: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(_BLOCK_FETCH_CONCURRENCY)
+    )
+    # 하위 블록 원본 ID -> 조회 작업. 동기화 블록 사본처럼 같은 내용을 가리키는 블록은 한 번만 조회한다.
+    children: Dict[str, "asyncio.Future[List[Dict[str, Any]]]"] = field(default_factory=dict)
+
+
+def _children_source_id(block: Dict[str, Any]) -> str:
+    """Return the id whose children ``block`` actually shows."""
+
+    if block.get("type") == "synced_block":
+        synced_from = (block.get("synced_block") or {}).get("synced_from")
+        if isinstance(synced_from, dict) and synced_from.get("block_id"):
+            return str(synced_from["block_id"])
+    return str(block.get("id"))
+
+
+async def _collect_children(
+    client: AsyncClient,
+    block_id: str,
+    ctx: _BlockFetchContext,
+) -> List[Dict[str, Any]]:
     """Iterate through children blocks handling pagination."""
 
     start_cursor: Optional[str] = None
     results: List[Dict[str, Any]] = []
 
+    async def _list_page() -> Dict[str, Any]:
+        async with ctx.limiter:
+            return await client.blocks.children.list(
+                block_id=block_id,
+                start_cursor=start_cursor,
+                page_size=100,
+            )
+
     while True:
-        response = await client.blocks.children.list(
-            block_id=block_id,
-            start_cursor=start_cursor,
-            page_size=100,
-        )
+        response = await _call_with_backoff(_list_page)
         batch = response.get("results", [])
         results.extend(batch)
         if not response.get("has_more"):
@@ -267,7 +327,40 @@ async def _collect_children(client: AsyncClient, block_id: str) -> List[Dict[str
     return results
 
 
-async def _build_text_block_tree(client: AsyncClient, block: Dict[str, Any]) -> Optional[TextBlock]:
+async def _collect_children_once(
+    client: AsyncClient,
+    block: Dict[str, Any],
+    ctx: _BlockFetchContext,
+) -> List[Dict[str, Any]]:
+    """Return children of ``block``, reusing a fetch already made for the same source."""
+
+    source_id = _children_source_id(block)
+    future = ctx.children.get(source_id)
+    if future is None:
+        future = asyncio.ensure_future(_collect_children(client, str(block.get("id")), ctx))
+        ctx.children[source_id] = future
+    # 같은 조회를 기다리는 다른 작업이 취소되어도 공유 작업은 계속 진행되도록 보호한다.
+    return await asyncio.shield(future)
+
+
+async def _build_text_block_trees(
+    client: AsyncClient,
+    blocks: List[Dict[str, Any]],
+    ctx: _BlockFetchContext,
+) -> List[TextBlock]:
+    """Convert sibling blocks concurrently, keeping their original order."""
+
+    trees = await asyncio.gather(
+        *(_build_text_block_tree(client, block, ctx) for block in blocks)
+    )
+    return [tree for tree in trees if tree]
+
+
+async def _build_text_block_tree(
+    client: AsyncClient,
+    block: Dict[str, Any],
+    ctx: _BlockFetchContext,
+) -> Optional[TextBlock]:
     block_type = block.get("type", "")
     if block_type in _SKIP_BLOCK_TYPES:
         return None
@@ -276,11 +369,9 @@ async def _build_text_block_tree(client: AsyncClient, block: Dict[str, Any]) ->
     children: List[TextBlock] = []
 
     if block.get("has_children") and block_type != "child_page":
-        child_blocks = await _collect_children(client, block.get("id"))
-        for child in child_blocks:
-            child_text_block = await _build_text_block_tree(client, child)
-            if child_text_block:
-                children.append(child_text_block)
+        child_blocks = await _collect_children_once(client, block, ctx)
+        # 형제 블록의 하위 트리는 서로 독립적이므로 동시에 탐색한다.
+        children = await _build_text_block_trees(client, child_blocks, ctx)
 
     if not texts and not children:
         return None
@@ -293,16 +384,17 @@ async def _build_text_block_tree(client: AsyncClient, block: Dict[str, Any]) ->
     )
 
 
-async def _fetch_page_blocks(client: AsyncClient, page_id: str) -> List[TextBlock]:
+async def _fetch_page_blocks(
+    client: AsyncClient,
+    page_id: str,
+    ctx: Optional[_BlockFetchContext] = None,
+) -> List[TextBlock]:
     """Fetch blocks for a page and convert them into `TextBlock` instances."""
 
-    blocks = await _collect_children(client, page_id)
-    results: List[TextBlock] = []
-    for block in blocks:
-        text_block = await _build_text_block_tree(client, block)
-        if text_block:
-            results.append(text_block)
-    return results
+    if ctx is None:
+        ctx = _BlockFetchContext()
+    blocks = await _collect_children(client, page_id, ctx)
+    return await _build_text_block_trees(client, blocks, ctx)
 
 
 async def pull_page_text(
@@ -318,8 +410,8 @@ async def pull_page_text(
 
     refreshed = await ensure_valid_access_token(db, cred)
 
-    async with AsyncClient(auth=refreshed.access_token, notion_version=_NOTION_VERSION) as client:
-        blocks = await _fetch_page_blocks(client, page_id)
+    client = build_api_client(refreshed.access_token)
+    blocks = await _fetch_page_blocks(client, page_id)
 
     return {
         "page_id": page_id,
@@ -333,11 +425,13 @@ async def _iter_shared_pages(client: AsyncClient) -> AsyncIterator[Dict[str, Any
     start_cursor: Optional[str] = None
 
     while True:
-        response = await client.search(
-            filter={"property": "object", "value": "page"},
-            sort={"direction": "descending", "timestamp": "last_edited_time"},
-            start_cursor=start_cursor,
-            page_size=100,
+        response = await _call_with_backoff(
+            lambda: client.search(
+                filter={"property": "object", "value": "page"},
+                sort={"direction": "descending", "timestamp": "last_edited_time"},
+                start_cursor=start_cursor,
+                page_size=100,
+            )
         )
         for item in response.get("results", []):
             if item.get("object") == "page":
@@ -355,12 +449,22 @@ def _extract_page_title(page: Dict[str, Any]) -> str:
     # Root pages expose title within the `properties` payload.
     properties = page.get("properties")
     if isinstance(properties, dict):
-        for prop in properties.values():
-            if isinstance(prop, dict) and prop.get("type") == "title":
-                title_items = prop.get("title", [])
-                title = _flatten_rich_text(title_items)
-                if title:
-                    return " ".join(title).strip()
+        # 페이지의 title 속성은 하나뿐이고 일반 페이지는 키가 "title"이므로 먼저 직접 조회하고,
+        # 데이터베이스 항목처럼 이름이 다른 경우에만 전체 속성을 훑는다.
+        prop = properties.get("title")
+        if not (isinstance(prop, dict) and prop.get("type") == "title"):
+            prop = next(
+                (
+                    candidate
+                    for candidate in properties.values()
+                    if isinstance(candidate, dict) and candidate.get("type") == "title"
+                ),
+                None,
+            )
+        if prop is not None:
+            title = _flatten_rich_text(prop.get("title", []))
+            if title:
+                return " ".join(title).strip()
 
     # As a fallback, check the top-level `title` key (databases use this shape).
     title_items = page.get("title")
@@ -391,44 +495,57 @@ async def pull_all_shared_page_text(
     if updated_after:
         comparison_point = _normalize_to_utc(updated_after)
 
-    async with AsyncClient(auth=refreshed.access_token, notion_version=_NOTION_VERSION) as client:
-        pages: List[Dict[str, Any]] = []
-        total_pages = 0
-        skipped_pages = 0
-        skipped_page_details: List[Dict[str, Any]] = []
-        attempted_at = datetime.now(timezone.utc)
-        comparison_point_iso = comparison_point.isoformat() if comparison_point else None
-
-        async for page in _iter_shared_pages(client):
-            total_pages += 1
-            page_id = str(page.get("id"))
-            notion_last_edited_str = page.get("last_edited_time")
-            notion_timestamp = _parse_notion_timestamp(notion_last_edited_str)
-            notion_timestamp_iso = notion_timestamp.isoformat() if notion_timestamp else None
-
-            if comparison_point and notion_timestamp and notion_timestamp <= comparison_point:
-                skipped_pages += 1
-                skipped_page_details.append(
-                    {
-                        "page_id": page_id,
-                        "last_edited_time": notion_last_edited_str,
-                        "last_edited_time_utc": notion_timestamp_iso,
-                        "comparison_point": comparison_point_iso,
-                        "attempted_at": attempted_at.isoformat(),
-                    }
-                )
-                continue
-
-            blocks = await _fetch_page_blocks(client, page_id)
-            pages.append(
+    client = build_api_client(refreshed.access_token)
+    pages: List[Dict[str, Any]] = []
+    total_pages = 0
+    skipped_pages = 0
+    skipped_page_details: List[Dict[str, Any]] = []
+    attempted_at = datetime.now(timezone.utc)
+    comparison_point_iso = comparison_point.isoformat() if comparison_point else None
+
+    async for page in _iter_shared_pages(client):
+        total_pages += 1
+        page_id = str(page.get("id"))
+        notion_last_edited_str = page.get("last_edited_time")
+        notion_timestamp = _parse_notion_timestamp(notion_last_edited_str)
+        notion_timestamp_iso = notion_timestamp.isoformat() if notion_timestamp else None
+
+        if comparison_point and notion_timestamp and notion_timestamp <= comparison_point:
+            skipped_pages += 1
+            skipped_page_details.append(
                 {
                     "page_id": page_id,
-                    "title": _extract_page_title(page),
-                    "last_edited_time": page.get("last_edited_time"),
-                    "url": page.get("url"),  # 페이지 URL을 포함하여 후속 단계에서 근거 링크로 활용하는 주석
-                    "blocks": [block.to_dict() for block in blocks],
+                    "last_edited_time": notion_last_edited_str,
+                    "last_edited_time_utc": notion_timestamp_iso,
+                    "comparison_point": comparison_point_iso,
+                    "attempted_at": attempted_at.isoformat(),
                 }
             )
+            continue
+
+        pages.append(
+            {
+                "page_id": page_id,
+                "title": _extract_page_title(page),
+                "last_edited_time": page.get("last_edited_time"),
+                "url": page.get("url"),  # 페이지 URL을 포함하여 후속 단계에서 근거 링크로 활용하는 주석
+            }
+        )
+
+    # 페이지마다 순차로 블록을 가져오지 않고, 동시 요청 수를 제한해 병렬로 수집한다.
+    semaphore = asyncio.Semaphore(_PAGE_FETCH_CONCURRENCY)
+    # 페이지 내부의 하위 블록 요청 수 상한과 조회 결과 재사용을 모든 페이지가 공유한다.
+    fetch_ctx = _BlockFetchContext()
+
+    async def _fetch_bounded(page_id: str) -> List[TextBlock]:
+        async with semaphore:
+            return await _fetch_page_blocks(client, page_id, fetch_ctx)
+
+    page_blocks = await asyncio.gather(
+        *(_fetch_bounded(entry["page_id"]) for entry in pages)
+    )
+    for entry, blocks in zip(pages, page_blocks):
+        entry["blocks"] = [block.to_dict() for block in blocks]
 
     return {
         "pages": pages,
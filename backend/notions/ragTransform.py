@@ -114,7 +114,7 @@ class AnnotatedSegment:
 def _build_annotated_segments(blocks: Sequence[RenderedBlock]) -> List[AnnotatedSegment]:
     """Convert rendered blocks into annotated Markdown segments."""
 
-    segments: List[AnnotatedSegment] = []
+    pending: List[tuple[RenderedBlock, str, str, str]] = []
     total = len(blocks)
 
     for index, block in enumerate(blocks):
@@ -122,7 +122,6 @@ def _build_annotated_segments(blocks: Sequence[RenderedBlock]) -> List[Annotated
             continue
 
         marker = _marker_for_type(block.type)
-        plain_body = block.text
         if "\n" in block.text:
             body = f"[[{marker}]]\n{block.text}\n[[/{marker}]]"
         else:
@@ -135,20 +134,26 @@ def _build_annotated_segments(blocks: Sequence[RenderedBlock]) -> List[Annotated
         else:
             separator = "\n"
 
-        token_length = count_tokens(body + separator)
-        segments.append(
-            AnnotatedSegment(
-                type=block.type,
-                depth=block.depth,
-                marker=marker,
-                body=body,
-                plain_body=plain_body,
-                separator=separator,
-                token_length=token_length,
-            )
-        )
+        pending.append((block, marker, body, separator))
 
-    return segments
+    if not pending:
+        return []
+
+    # 블록마다 encode를 호출하지 않고 페이지 단위로 한 번에 토큰화한다.
+    token_lists = _ENC.encode_batch([body + separator for _, _, body, separator in pending])
+
+    return [
+        AnnotatedSegment(
+            type=block.type,
+            depth=block.depth,
+            marker=marker,
+            body=body,
+            plain_body=block.text,
+            separator=separator,
+            token_length=len(tokens),
+        )
+        for (block, marker, body, separator), tokens in zip(pending, token_lists)
+    ]
 
 def _update_fence_state(text: str, fence_open: bool) -> bool:
     """Track fenced code block boundaries while scanning text."""
@@ -5,13 +5,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
 from dataclasses import asdict
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from notion_client.errors import APIResponseError
 
-from ai_module import WorkspaceAgentOrchestrator
 from notions.notionAuth import NotionCredentialError
 from dependencies import get_current_user
 from models import User
@@ -19,10 +20,30 @@ from schema.aiagent import SearchRequest, SearchResponse
 from utils.db import get_db
 from utils.workspace import WorkspaceResolutionError, get_workspace_context
 
+if TYPE_CHECKING:
+    from ai_module import WorkspaceAgentOrchestrator
+
 router = APIRouter(prefix="/aiagent", tags=["aiagent"])
 
 logger = logging.getLogger("arcana")
-_orchestrator = WorkspaceAgentOrchestrator()
+_orchestrator: Optional[WorkspaceAgentOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_orchestrator() -> WorkspaceAgentOrchestrator:
+    """오케스트레이터를 처음 필요할 때 한 번만 생성한다.
+
+    LLM 클라이언트와 LangGraph 그래프 구성이 무거워 임포트 시점에 만들면 서버 기동이 늦어진다.
+    """
+
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                from ai_module import WorkspaceAgentOrchestrator
+
+                _orchestrator = WorkspaceAgentOrchestrator()
+    return _orchestrator
 
 
 @router.post(
@@ -55,8 +76,10 @@ async def search_workspace_documents(
                 return True
             await asyncio.sleep(0.1)
 
+    # 기동 직후 사전 로드가 끝나지 않았다면 이벤트 루프를 막지 않도록 스레드에서 생성한다.
+    orchestrator = await asyncio.to_thread(get_orchestrator)
     orchestrator_task = asyncio.create_task(
-        _orchestrator.run(
+        orchestrator.run(
             db=db,
             user_idx=user.idx,
             workspace=context.workspace,
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse, JSONResponse
-from sqlalchemy import delete, select
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 
 from dependencies import get_current_user
@@ -18,6 +20,7 @@ from models import (
     User,
     Workspace,
 )
+from utils.batching import iter_batches
 from utils.db import get_db
 from utils.workspace import resolve_user_primary_workspace, WorkspaceResolutionError
 from utils.workspace_storage import ensure_workspace_storage
@@ -65,22 +68,8 @@ rag_service = ChromaRAGService()
 def _resolve_root_folder_id(credential: GoogleDriveOauthCredentials) -> str:
     """워크스페이스로 지정된 Google Drive 루트 폴더 ID를 반환한다."""
 
-    payload: Any = credential.provider_payload or {}
-    if isinstance(payload, str):
-        try:
-            payload = json.loads(payload)
-        except json.JSONDecodeError:
-            payload = {}
-
-    if isinstance(payload, dict):
-        root_id = (
-            payload.get("workspace_root_id")
-            or payload.get("root_folder_id")
-            or payload.get("selected_folder_id")
-        )
-    else:
-        root_id = None
-
+    # provider_payload 전체를 읽지 않고 DB 생성 컬럼(workspace_root_id)을 사용한다.
+    root_id = credential.workspace_root_id
     return str(root_id) if root_id else "root"
 
 
@@ -163,6 +152,50 @@ def _apply_snapshot_metadata(
     snapshot.updated = synced_at
 
 
+def _build_snapshot_row(
+    metadata: Dict[str, Any],
+    *,
+    data_source_idx: int,
+    file_id: str,
+    mime_type: str,
+    synced_at: datetime,
+) -> Dict[str, Any]:
+    """신규 스냅샷 INSERT에 사용할 컬럼 값 딕셔너리를 생성한다."""
+
+    return {
+        "data_source_idx": data_source_idx,
+        "file_id": file_id,
+        "name": metadata.get("name") or None,
+        "mime_type": metadata.get("mimeType") or mime_type,
+        "md5_checksum": metadata.get("md5Checksum") or None,
+        "version": _safe_int(metadata.get("version")),
+        "modified_time": _parse_google_datetime(metadata.get("modifiedTime")),
+        "web_view_link": metadata.get("webViewLink") or None,
+        "last_synced": synced_at,
+        # created/updated는 DB 기본값(CURRENT_TIMESTAMP)으로 채운다.
+    }
+
+
+def _upsert_snapshot_rows(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """스냅샷 행을 uk_google_drive_file 기준 INSERT ... ON DUPLICATE KEY UPDATE로 배치 기록한다."""
+
+    table = GoogleDriveFileSnapshot.__table__
+    stmt = mysql_insert(table)
+    stmt = stmt.on_duplicate_key_update(
+        # 메타데이터에 값이 없으면 기존 값을 유지한다(_apply_snapshot_metadata와 동일).
+        name=func.coalesce(stmt.inserted.name, table.c.name),
+        mime_type=stmt.inserted.mime_type,
+        md5_checksum=stmt.inserted.md5_checksum,
+        version=stmt.inserted.version,
+        modified_time=stmt.inserted.modified_time,
+        web_view_link=func.coalesce(stmt.inserted.web_view_link, table.c.web_view_link),
+        last_synced=stmt.inserted.last_synced,
+        updated=func.now(),
+    )
+    for batch in iter_batches(rows):
+        db.execute(stmt, batch)
+
+
 def _ensure_sync_state(db: Session, data_source: DataSource) -> GoogleDriveSyncState:
     """Google Drive 동기화 상태 레코드를 조회하거나 생성한다."""
 
@@ -259,7 +292,7 @@ def ensure_google_drive_connection(
     credential = _ensure_google_resources(db, user=user, workspace=workspace)
 
     state = make_state(cred_idx=credential.idx, user_idx=user.idx)
-    url = build_authorize_url(state)
+    url = build_authorize_url(state, force_consent=not credential.refresh_token)
     return {"authorize_url": url}
 
 
@@ -322,7 +355,8 @@ async def google_drive_oauth_callback(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="code/state 누락")
 
     try:
-        cred_idx, user_idx = verify_state(state)
+        # 재사용 차단 기록(Redis)이 블로킹 호출이므로 이벤트 루프 밖에서 검증한다.
+        cred_idx, user_idx = await run_in_threadpool(verify_state, state)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -636,22 +670,24 @@ async def pull_google_drive_files(
 
     meta_by_id = {metadata.get("id"): metadata for metadata in index_candidates if metadata.get("id")}
 
+    upsert_rows: Dict[str, Dict[str, Any]] = {}
     for file in converted_files:
         file_meta = meta_by_id.get(file.file_id)
         if not file_meta:
             continue
-        snapshot = snapshots.get(file.file_id)
-        if not snapshot:
-            snapshot = GoogleDriveFileSnapshot(
-                data_source_idx=data_source.idx,
-                file_id=file.file_id,
-                mime_type=file.mime_type,
-            )
-            db.add(snapshot)
-            snapshots[file.file_id] = snapshot
-        _apply_snapshot_metadata(snapshot, file_meta, synced_at=now, update_synced=True)
+        upsert_rows[file.file_id] = _build_snapshot_row(
+            file_meta,
+            data_source_idx=data_source.idx,
+            file_id=file.file_id,
+            mime_type=file.mime_type,
+            synced_at=now,
+        )
+
+    # 변환된 파일의 스냅샷은 신규/기존 구분 없이 행 단위 UPDATE 대신 배치 upsert로 기록한다.
+    _upsert_snapshot_rows(db, upsert_rows.values())
 
     removed_ids_clean: List[str] = []
+    removed_snapshot_idxs: List[int] = []
     removed_file_details: List[Dict[str, Optional[str]]] = []
     for file_id in removed_file_ids:
         if not file_id:
@@ -670,7 +706,7 @@ async def pull_google_drive_files(
                     "web_view_link": snapshot.web_view_link,
                 }
             )
-            db.delete(snapshot)
+            removed_snapshot_idxs.append(snapshot.idx)
         else:
             removed_file_details.append(
                 {
@@ -682,6 +718,12 @@ async def pull_google_drive_files(
                 }
             )
 
+    # 삭제된 파일의 스냅샷은 행 단위 DELETE 대신 배치 단위 DELETE ... IN으로 지운다.
+    for batch in iter_batches(removed_snapshot_idxs):
+        db.execute(
+            delete(GoogleDriveFileSnapshot).where(GoogleDriveFileSnapshot.idx.in_(batch))
+        )
+
     workspace_metadata = {
         "workspace_idx": workspace.idx,
         "workspace_type": workspace.type,
@@ -692,7 +734,8 @@ async def pull_google_drive_files(
     records = build_records_from_files(converted_files)
     documents = build_documents_from_records(records, workspace_metadata)
 
-    jsonl_lines = [json.dumps(record, ensure_ascii=False) for record in records]
+    record_dicts = [record.to_dict() for record in records]
+    jsonl_lines = [json.dumps(record, ensure_ascii=False) for record in record_dicts]
     jsonl_text = "\n".join(jsonl_lines)
 
     rag_index = db.scalar(
@@ -783,7 +826,7 @@ async def pull_google_drive_files(
             }
             for file in converted_files
         ],
-        "jsonl_records": records,
+        "jsonl_records": record_dicts,
         "jsonl_text": jsonl_text,
         "skipped_files": skipped_files,
         "removed_files": removed_file_details,
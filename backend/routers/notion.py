@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-import json
 from typing import Optional
 
+import orjson
+
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from notion_client.errors import APIResponseError
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 
 from dependencies import get_current_user
@@ -69,15 +72,17 @@ def _resolve_workspace(db: Session, user: User) -> Workspace:
 
 def _ensure_notion_resources(
     db: Session, *, user: User, workspace: Workspace
-):
-    data_source = db.scalar(
-        select(DataSource).where(
+) -> int:
+    """Notion 데이터 소스와 사용자 자격증명 행을 보장하고 자격증명 idx를 반환한다."""
+
+    data_source_idx = db.scalar(
+        select(DataSource.idx).where(
             DataSource.workspace_idx == workspace.idx,
             DataSource.type == "notion",
         )
     )
 
-    if not data_source:
+    if data_source_idx is None:
         data_source = DataSource(
             workspace_idx=workspace.idx,
             type="notion",
@@ -86,31 +91,26 @@ def _ensure_notion_resources(
         )
         db.add(data_source)
         db.flush()
-
-    credential = db.scalar(
-        select(NotionOauthCredentials).where(
-            NotionOauthCredentials.data_source_idx == data_source.idx,
-            NotionOauthCredentials.user_idx == user.idx,
-        )
+        data_source_idx = data_source.idx
+
+    # SELECT 후 분기해 INSERT하지 않고 uk_ds_user 기준 단일 upsert로 처리한다.
+    # 이미 있으면 LAST_INSERT_ID(idx)로 기존 idx를 돌려받는다(동시 요청에도 중복 행이 생기지 않음).
+    stmt = mysql_insert(NotionOauthCredentials).values(
+        user_idx=user.idx,
+        data_source_idx=data_source_idx,
+        provider="notion",
+        bot_id=f"pending-{data_source_idx}-{user.idx}",
+        token_type="bearer",
+        access_token="",
     )
-
-    if not credential:
-        credential = NotionOauthCredentials(
-            user_idx=user.idx,
-            data_source_idx=data_source.idx,
-            provider="notion",
-            bot_id=f"pending-{data_source.idx}-{user.idx}",
-            token_type="bearer",
-            access_token="",
-        )
-        db.add(credential)
-        db.flush()
+    stmt = stmt.on_duplicate_key_update(
+        idx=func.LAST_INSERT_ID(NotionOauthCredentials.idx),
+    )
+    credential_idx = db.execute(stmt).lastrowid
 
     db.commit()
-    db.refresh(data_source)
-    db.refresh(credential)
 
-    return credential
+    return credential_idx
 
 
 def _append_query_params(base_url: str, params: dict[str, str | None]) -> str:
@@ -147,16 +147,20 @@ async def _sync_notion_workspace(
         "workspace_type": workspace.type,
         "workspace_name": workspace.name,
     }
-    jsonl_records = build_jsonl_records_from_pages(payload.get("pages", []))
+    # 토큰화/임베딩 적재는 동기 CPU·네트워크 작업이므로 이벤트 루프 밖에서 실행한다.
+    jsonl_records = await run_in_threadpool(
+        build_jsonl_records_from_pages, payload.get("pages", [])
+    )
     documents = build_documents_from_records(jsonl_records, workspace_metadata)
-    jsonl_lines = [json.dumps(record, ensure_ascii=False) for record in jsonl_records]
+    jsonl_lines = [orjson.dumps(record).decode() for record in jsonl_records]
     jsonl_text = "\n".join(jsonl_lines)
 
     storage_path = ensure_workspace_storage(workspace.name)
     storage_uri = rag_index.storage_uri if rag_index and rag_index.storage_uri else str(storage_path)
 
     try:
-        ingested_count = rag_service.replace_documents(
+        ingested_count = await run_in_threadpool(
+            rag_service.replace_documents,
             workspace.idx,
             workspace.name,
             documents,
@@ -219,10 +223,10 @@ def ensure_notion_connection(
 ):
     """로그인한 사용자의 워크스페이스에 Notion 데이터 소스와 자격 증명을 보장한다."""
     workspace = _resolve_workspace(db, user)
-    credential = _ensure_notion_resources(db, user=user, workspace=workspace)
+    credential_idx = _ensure_notion_resources(db, user=user, workspace=workspace)
 
     # state 생성 후 Notion 동의 화면으로 리디렉션
-    state = make_state(cred_idx=credential.idx, user_idx=user.idx)
+    state = make_state(cred_idx=credential_idx, user_idx=user.idx)
     url = build_authorize_url(state)
 
     return {"authorize_url": url}
@@ -283,7 +287,8 @@ async def notion_oauth_callback(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="code/state 누락")
 
     try:
-        cred_idx, user_idx = verify_state(state)
+        # 재사용 차단 기록(Redis)이 블로킹 호출이므로 이벤트 루프 밖에서 검증한다.
+        cred_idx, user_idx = await run_in_threadpool(verify_state, state)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -495,9 +500,11 @@ async def pull_all_pages(
         "workspace_type": workspace.type,
         "workspace_name": workspace.name,
     }
-    jsonl_records = build_jsonl_records_from_pages(payload.get("pages", []))  # 수집된 페이지를 JSONL 레코드로 전처리하는 주석
+    jsonl_records = await run_in_threadpool(
+        build_jsonl_records_from_pages, payload.get("pages", [])
+    )  # 수집된 페이지를 JSONL 레코드로 전처리(토큰화)하되 이벤트 루프를 막지 않도록 스레드풀에서 실행하는 주석
     documents = build_documents_from_records(jsonl_records, workspace_metadata)  # 전처리된 레코드를 LangChain 문서로 변환하는 주석
-    jsonl_lines = [json.dumps(record, ensure_ascii=False) for record in jsonl_records]  # 레코드를 JSON 문자열로 직렬화하는 주석
+    jsonl_lines = [orjson.dumps(record).decode() for record in jsonl_records]  # 레코드를 orjson으로 JSON 문자열 직렬화하는 주석
     jsonl_text = "\n".join(jsonl_lines)  # JSONL 텍스트를 생성하기 위해 줄바꿈으로 결합하는 주석
 
     if logger.isEnabledFor(logging.DEBUG):  # 디버그 레벨에서만 전처리 결과를 기록하도록 조건을 설정하는 주석
@@ -510,12 +517,13 @@ async def pull_all_pages(
 
     try:
         if documents:
-            ingested_count = rag_service.replace_documents(
+            ingested_count = await run_in_threadpool(
+                rag_service.replace_documents,
                 workspace.idx,
                 workspace.name,
                 documents,
                 storage_uri=storage_uri,
-            )  # 변환된 문서를 Chroma에 적재하고 개수 반환 주석
+            )  # 변환된 문서를 스레드풀에서 Chroma에 적재하고 개수 반환 주석
         else:
             ingested_count = 0
     except RuntimeError as exc:  # Azure OpenAI 구성 누락 등 구성 오류 처리 주석
@@ -561,10 +569,13 @@ async def pull_all_pages(
             detail="RAG 인덱스 메타데이터를 갱신하는 중 오류가 발생했습니다.",
         ) from exc
 
-    return {
-        **payload,  # 원본 Notion 수집 결과를 포함하는 주석
-        "jsonl_records": jsonl_records,
-        "jsonl_text": jsonl_text, 
-        "ingested_chunks": ingested_count,  # Chroma에 적재된 청크 수를 포함
-        "last_synced_at": last_synced_at.isoformat() if last_synced_at else None,
-    }
+    # 전체 페이지 블록 트리를 담는 큰 응답이므로 jsonable_encoder 순회 없이 orjson으로 바로 직렬화한다.
+    return ORJSONResponse(
+        content={
+            **payload,  # 원본 Notion 수집 결과를 포함하는 주석
+            "jsonl_records": jsonl_records,
+            "jsonl_text": jsonl_text,
+            "ingested_chunks": ingested_count,  # Chroma에 적재된 청크 수를 포함
+            "last_synced_at": last_synced_at.isoformat() if last_synced_at else None,
+        }
+    )
@@ -385,8 +385,14 @@ def list_external_tool_connections(
             detail=str(exc),
         ) from exc
 
-    data_sources = db.scalars(
-        select(DataSource).where(
+    # 응답에 필요한 컬럼만 Row로 읽어 ORM 객체 구성/identity map 등록을 생략한다.
+    data_sources = db.execute(
+        select(
+            DataSource.type,
+            DataSource.name,
+            DataSource.status,
+            DataSource.synced,
+        ).where(
             DataSource.workspace_idx == workspace.idx,
         )
     ).all()
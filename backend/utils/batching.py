@@ -0,0 +1,31 @@
+"""Helpers for splitting sequences into fixed-size batches."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, TypeVar
+
+__all__ = ["DEFAULT_BATCH_SIZE", "iter_batches"]
+
+DEFAULT_BATCH_SIZE = 1000
+
+_T = TypeVar("_T")
+
+
+def iter_batches(items: Iterable[_T], size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[_T]]:
+    """항목을 ``size`` 단위 리스트로 잘라 순서대로 반환한다.
+
+    색인 대상 메타데이터를 ``session.execute(insert(Model), batch)``처럼
+    executemany 형태로 기록할 때 사용한다.
+    """
+
+    if size <= 0:
+        raise ValueError("size는 1 이상이어야 합니다.")
+
+    batch: List[_T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,7 +1,9 @@
 # utils/db.py
 from __future__ import annotations
 import os
-from sqlalchemy import create_engine
+from typing import Any, Mapping
+
+from sqlalchemy import JSON, create_engine, func, literal
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 MYSQL_HOST = os.getenv("MYSQL_HOST")
@@ -9,6 +11,9 @@ MYSQL_PORT = os.getenv("MYSQL_PORT")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
 MYSQL_USER = os.getenv("MYSQL_USER")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
+# 동기 라우트는 스레드풀(기본 40)에서 실행되므로 기본 풀(5+10)보다 넉넉히 잡는다.
+MYSQL_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "20"))
+MYSQL_MAX_OVERFLOW = int(os.getenv("MYSQL_MAX_OVERFLOW", "10"))
 
 DATABASE_URL = (
     f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
@@ -18,7 +23,11 @@ DATABASE_URL = (
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=1800,  # LB/서버 idle timeout보다 먼저 연결을 교체
+    pool_size=MYSQL_POOL_SIZE,
+    max_overflow=MYSQL_MAX_OVERFLOW,
+    pool_use_lifo=True,  # 최근 쓴 연결을 재사용해 유휴 연결이 자연스럽게 정리되도록 함
+    insertmanyvalues_page_size=1000,  # executemany INSERT를 1000행 단위로 묶음
     echo=False,  # 디버깅 시 True
 )
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False, autocommit=False)
@@ -30,3 +39,20 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def json_shallow_merge(column: Any, data: Mapping[str, Any]) -> Any:
+    """``column`` JSON 객체의 최상위 키만 ``data`` 값으로 덮어쓰는 SQL 식을 만든다.
+
+    JSON_MERGE_PATCH와 달리 null 값도 키로 남기고 중첩 객체는 병합하지 않고 통째로 교체한다.
+    """
+
+    base = func.COALESCE(column, func.JSON_OBJECT())
+    if not data:
+        return base
+    args: list[Any] = [base]
+    for key, value in data.items():
+        escaped = str(key).replace("\\", "\\\\").replace('"', '\\"')
+        # 문자열 바인드 값이 JSON 문자열로 이중 인코딩되지 않도록 JSON 값으로 다시 파싱한다.
+        args.extend((f'$."{escaped}"', func.JSON_EXTRACT(literal(value, JSON), "$")))
+    return func.JSON_SET(*args)
@@ -0,0 +1,124 @@
+"""Shared ``httpx.AsyncClient`` registry."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+__all__ = [
+    "GZIP_USER_AGENT",
+    "RETRYABLE_STATUS_CODES",
+    "close_async_clients",
+    "get_async_client",
+    "get_async_transport",
+    "get_with_retry",
+]
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Google API는 Accept-Encoding과 함께 User-Agent에 "gzip"이 있어야 응답을 압축해 준다.
+GZIP_USER_AGENT = "arcana/1.0 (gzip)"
+
+_CLIENTS: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+_TRANSPORTS: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]] = {}
+
+
+def get_async_client(name: str, **options: Any) -> httpx.AsyncClient:
+    """Return the pooled client registered under ``name`` for the running event loop.
+
+    ``options`` are passed to ``httpx.AsyncClient`` only when a new client is created.
+    """
+
+    loop = asyncio.get_running_loop()
+    entry = _CLIENTS.get(name)
+    if entry is not None:
+        owner, client = entry
+        # asyncio.run()으로 루프가 바뀐 경우에는 이전 루프의 커넥션을 재사용할 수 없다.
+        if owner is loop and not client.is_closed:
+            return client
+
+    client = httpx.AsyncClient(**options)
+    _CLIENTS[name] = (loop, client)
+    return client
+
+
+def get_async_transport(name: str, **options: Any) -> httpx.AsyncHTTPTransport:
+    """Return the pooled transport registered under ``name`` for the running event loop.
+
+    Use this when each caller needs its own client settings (e.g. per-user auth headers)
+    but should still share one connection pool. Clients wrapping the transport must not
+    be closed, since closing a client also closes its transport.
+    """
+
+    loop = asyncio.get_running_loop()
+    entry = _TRANSPORTS.get(name)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    transport = httpx.AsyncHTTPTransport(**options)
+    _TRANSPORTS[name] = (loop, transport)
+    return transport
+
+
+async def close_async_clients() -> None:
+    """Close every client and transport created on the running event loop."""
+
+    loop = asyncio.get_running_loop()
+    for name, (owner, client) in list(_CLIENTS.items()):
+        if owner is not loop:
+            continue
+        del _CLIENTS[name]
+        await client.aclose()
+    for name, (owner, transport) in list(_TRANSPORTS.items()):
+        if owner is not loop:
+            continue
+        del _TRANSPORTS[name]
+        await transport.aclose()
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    attempts: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a GET request, retrying transport errors and 429/5xx responses.
+
+    Delays grow exponentially with jitter and honour ``Retry-After`` when present.
+    The last response is returned as-is so callers keep their own status handling.
+    """
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.TransportError:
+            if attempt >= attempts:
+                raise
+            delay = None
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= attempts:
+                return response
+            delay = _retry_after_seconds(response)
+
+        if delay is None:
+            delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, base_delay)
+        await asyncio.sleep(min(delay, max_delay))
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        # HTTP-date 형식은 지수 백오프로 대체한다.
+        return None
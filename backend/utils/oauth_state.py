@@ -0,0 +1,113 @@
+"""Signed, self-verifying OAuth ``state`` helpers."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Tuple
+
+from utils.redis_client import get_redis
+
+__all__ = ["sign_state", "verify_signed_state"]
+
+_STATE_SECRET = os.getenv("OAUTH_STATE_SECRET") or os.getenv("JWT_SECRET_KEY")
+if not _STATE_SECRET:
+    raise RuntimeError("OAUTH_STATE_SECRET 또는 JWT_SECRET_KEY 환경 변수를 설정하세요.")
+
+# keyed BLAKE2b 키는 최대 64바이트이므로 더 긴 시크릿은 해시해서 사용한다.
+_SECRET_BYTES = _STATE_SECRET.encode("utf-8")
+if len(_SECRET_BYTES) > hashlib.blake2b.MAX_KEY_SIZE:
+    _SECRET_BYTES = hashlib.blake2b(_SECRET_BYTES).digest()
+_SIGNATURE_BYTES = 16
+_CLOCK_SKEW_SECONDS = 60
+_USED_KEY_PREFIX = "oauth:state:used:"
+
+# Redis가 없을 때 사용한 state 서명을 만료 시각(monotonic)과 함께 기록한다.
+# purpose마다 TTL이 다를 수 있어 삽입 순서가 만료 순서와 같지 않으므로, 만료 여부는 항목마다
+# 확인하고 최대 개수를 넘으면 가장 오래 전에 기록된 항목부터 버린다.
+_CONSUMED_MAX = 10_000
+_CONSUMED: "OrderedDict[str, float]" = OrderedDict()
+_CONSUMED_LOCK = threading.Lock()
+
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    padding = "=" * (-len(segment) % 4)
+    return base64.urlsafe_b64decode(segment + padding)
+
+
+def _sign(purpose: str, body: bytes) -> bytes:
+    # purpose를 서명에 포함해 다른 제공자의 콜백에서 재사용할 수 없도록 한다.
+    message = purpose.encode("utf-8") + b"|" + body
+    # keyed BLAKE2b는 HMAC-SHA256(해시 2회)보다 짧은 입력에서 빠르고 MAC으로 바로 쓸 수 있다.
+    return hashlib.blake2b(message, key=_SECRET_BYTES, digest_size=_SIGNATURE_BYTES).digest()
+
+
+def sign_state(purpose: str, *, cred_idx: int, user_idx: int) -> str:
+    """``cred_idx``/``user_idx``와 발급 시각을 담은 서명된 state 문자열을 만든다."""
+
+    body = f"{cred_idx}.{user_idx}.{int(time.time())}".encode("ascii")
+    return _b64url_encode(body + b"." + _sign(purpose, body))
+
+
+def verify_signed_state(purpose: str, state: str, *, ttl: timedelta) -> Tuple[int, int]:
+    """서명과 만료를 검증하고 ``(cred_idx, user_idx)``를 반환한다."""
+
+    try:
+        raw = _b64url_decode(state)
+        body = raw[: -_SIGNATURE_BYTES - 1]
+        separator = raw[-_SIGNATURE_BYTES - 1 : -_SIGNATURE_BYTES]
+        signature = raw[-_SIGNATURE_BYTES:]
+        if separator != b"." or len(signature) != _SIGNATURE_BYTES:
+            raise ValueError("state 구분자가 올바르지 않습니다.")
+        cred_raw, user_raw, issued_raw = body.decode("ascii").split(".")
+        cred_idx = int(cred_raw)
+        user_idx = int(user_raw)
+        issued_at = int(issued_raw)
+    except Exception as exc:  # noqa: BLE001 - 디코딩 에러 상세 노출 방지
+        raise ValueError("손상된 state 입니다.") from exc
+
+    if not hmac.compare_digest(signature, _sign(purpose, body)):
+        raise ValueError("state 검증 실패 또는 만료")
+
+    age = time.time() - issued_at
+    if age > ttl.total_seconds() or age < -_CLOCK_SKEW_SECONDS:
+        raise ValueError("state 검증 실패 또는 만료")
+
+    _consume_once(purpose, signature, ttl)
+    return cred_idx, user_idx
+
+
+def _consume_once(purpose: str, signature: bytes, ttl: timedelta) -> None:
+    """같은 state의 재사용을 차단한다.
+
+    Redis가 설정되어 있으면 워커 간에 공유되는 SET NX로, 없으면 프로세스 메모리로 기록한다.
+    Redis 호출은 블로킹이므로 async 핸들러에서는 스레드풀에서 검증해야 한다.
+    """
+
+    key = f"{_USED_KEY_PREFIX}{purpose}:{signature.hex()}"
+    client = get_redis()
+    if client is not None:
+        if not client.set(key, "1", ex=int(ttl.total_seconds()), nx=True):
+            raise ValueError("이미 사용된 state 입니다.")
+        return
+
+    now = time.monotonic()
+    with _CONSUMED_LOCK:
+        expired = [used_key for used_key, expires_at in _CONSUMED.items() if expires_at <= now]
+        for used_key in expired:
+            del _CONSUMED[used_key]
+        if key in _CONSUMED:
+            raise ValueError("이미 사용된 state 입니다.")
+        _CONSUMED[key] = now + ttl.total_seconds() + _CLOCK_SKEW_SECONDS
+        while len(_CONSUMED) > _CONSUMED_MAX:
+            _CONSUMED.popitem(last=False)
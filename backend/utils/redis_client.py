@@ -0,0 +1,27 @@
+"""Shared Redis client helper."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import redis
+
+__all__ = ["REDIS_URL", "get_redis"]
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Return the process-wide Redis client, or ``None`` when Redis is not configured."""
+
+    global _client
+
+    if not REDIS_URL:
+        return None
+    if _client is None:
+        # 커넥션 풀은 스레드 안전하므로 프로세스 전체에서 하나의 클라이언트를 공유한다.
+        _client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    return _client
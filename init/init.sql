@@ -80,7 +80,7 @@ CREATE TABLE data_sources (
   status         ENUM('connected','disconnected','error') NOT NULL DEFAULT 'connected' COMMENT '연결 상태',
   synced         DATETIME NULL                     COMMENT '마지막 성공 동기화 시각',
   created        DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시각',
-  KEY idx_ws (workspace_idx),
+  KEY idx_ws_type (workspace_idx, type),  -- 워크스페이스별 소스 종류 조회(FK 인덱스 겸용)
   CONSTRAINT fk_ds_ws FOREIGN KEY (workspace_idx) REFERENCES workspaces(idx)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='외부 데이터 소스 연결(노션, 구글 드라이브 등)';
 
@@ -103,9 +103,10 @@ CREATE TABLE notion_oauth_credentials (
   provider_payload      JSON NULL                         COMMENT '원문 응답 보관(디버그/추적용)',
   UNIQUE KEY uk_provider_bot (provider, bot_id),
   UNIQUE KEY uk_ds_user (data_source_idx, user_idx),
+  KEY idx_provider_ws (provider, provider_workspace_id),  -- Notion workspace_id로 자격증명 조회
   CONSTRAINT fk_cred_user FOREIGN KEY (user_idx) REFERENCES users(idx),
   CONSTRAINT fk_cred_ds   FOREIGN KEY (data_source_idx) REFERENCES data_sources(idx)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='노션 OAuth 토큰/메타(비밀 값)';
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 ROW_FORMAT=DYNAMIC COMMENT='노션 OAuth 토큰/메타(비밀 값)';
 
 -- 7-1) OAuth 자격증명(구글 드라이브)
 CREATE TABLE google_drive_oauth_credentials (
@@ -124,11 +125,16 @@ CREATE TABLE google_drive_oauth_credentials (
   created         DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '자격증명 생성 시각',
   updated         DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '자격증명 갱신 시각',
   provider_payload JSON NULL                        COMMENT '원본 응답(JSON)',
+  workspace_root_id VARCHAR(255) AS (COALESCE(
+    provider_payload->>'$.workspace_root_id',
+    provider_payload->>'$.root_folder_id',
+    provider_payload->>'$.selected_folder_id'
+  )) STORED NULL                                    COMMENT '워크스페이스 루트 폴더 ID(provider_payload에서 생성)',
   UNIQUE KEY uk_google_ds_user (data_source_idx, user_idx),
   KEY idx_google_user (user_idx),
   CONSTRAINT fk_google_cred_user FOREIGN KEY (user_idx) REFERENCES users(idx),
   CONSTRAINT fk_google_cred_ds   FOREIGN KEY (data_source_idx) REFERENCES data_sources(idx)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='구글 드라이브 OAuth 토큰/메타(비밀 값)';
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 ROW_FORMAT=DYNAMIC COMMENT='구글 드라이브 OAuth 토큰/메타(비밀 값)';
 
 -- 8) 구글 드라이브 Changes API 동기화 상태
 CREATE TABLE google_drive_sync_state (
@@ -158,8 +164,7 @@ CREATE TABLE google_drive_file_snapshots (
   last_synced    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '마지막 인덱싱 시각',
   created        DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '레코드 생성 시각',
   updated        DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '레코드 갱신 시각',
-  UNIQUE KEY uk_google_drive_file (data_source_idx, file_id),
-  KEY idx_google_drive_file_ds (data_source_idx),
+  UNIQUE KEY uk_google_drive_file (data_source_idx, file_id),  -- data_source_idx 선두 컬럼으로 FK 인덱스 겸용
   CONSTRAINT fk_google_drive_file_ds FOREIGN KEY (data_source_idx) REFERENCES data_sources(idx)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='구글 드라이브 파일 콘텐츠 스냅샷';
 